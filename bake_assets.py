@@ -0,0 +1,29 @@
+"""
+Lost but Found - Asset Bake Command
+Pre-scales every image in ASSETS to its in-game size and writes the
+memory-mapped sprite file read by the AssetManager (SPRITE_CACHE_PATH).
+
+Usage:
+    python bake_assets.py            rebuild only changed assets
+    python bake_assets.py --force    rebuild everything
+"""
+
+import sys
+import time
+from config.settings import SPRITE_CACHE_PATH
+from game.managers.asset_manager import image_targets
+from game.managers.sprite_cache import bake_sprite_cache
+
+
+def main():
+    """bake entry point"""
+    force = '--force' in sys.argv[1:]
+    start = time.perf_counter()
+    counts = bake_sprite_cache(image_targets(), SPRITE_CACHE_PATH, force=force)
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"Baked {SPRITE_CACHE_PATH} in {elapsed:.0f} ms: "
+          f"{counts['rebuilt']} rebuilt, {counts['reused']} reused, {counts['failed']} failed")
+
+
+if __name__ == "__main__":
+    main()
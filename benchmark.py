@@ -0,0 +1,213 @@
+"""
+Lost but Found - Benchmark Scene
+Runs a busy gameplay scene (full desk, every customer slot taken, conveyor
+running) for a fixed number of frames and reports update / render frame times.
+Runs headless by default (SDL dummy drivers), set SDL_VIDEODRIVER to draw to a window.
+
+Usage:
+    python benchmark.py                     frame times with the current settings
+    python benchmark.py --frames 1200       longer run
+    python benchmark.py --compare-convert   before/after for display-format conversion
+    python benchmark.py --tier half         run with an asset quality tier (full/half/palettized)
+    python benchmark.py --compare-tiers     frame times and resident surface memory per tier
+    python benchmark.py --compare-dirty     full flips vs dirty rect presentation
+    python benchmark.py --desk-items 5      quieter scene (fewer items bumping into each other)
+    python benchmark.py --spawn-interval 1  busy conveyor (most of the queue is above the window)
+    python benchmark.py --render-res 800x450    render at a lower internal resolution
+    python benchmark.py --compare-res       frame times at full, 3/4 and half render resolution
+    python benchmark.py --backend sdl2      draw with the SDL2 texture backend
+    python benchmark.py --compare-backends  surface blits vs SDL2 textures
+    python benchmark.py --compare-thread    serial loop vs render thread (main thread frame times)
+"""
+
+import os
+import sys
+import time
+import random
+import statistics
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+from config.settings import *
+from game.game_manager import GameManager, GameState
+from game.managers.asset_manager import asset_manager
+from game.managers.text_cache import text_cache
+from game.render.dirty_rects import DirtyRectRenderer
+from game.entities.item import Item
+from game.entities.customer import Customer
+
+
+def get_arg(name, default):
+    """Read '--name value' from the command line"""
+    if name in sys.argv:
+        return type(default)(sys.argv[sys.argv.index(name) + 1])
+    return default
+
+
+def build_scene(game_manager, desk_items=30, spawn_interval=None, seed=7):
+    """Start a shift and fill the desk and the customer slots"""
+    random.seed(seed)
+    game_manager.change_state(GameState.GAMEPLAY)
+    state = game_manager.states[GameState.GAMEPLAY]
+    state.shift_duration = 24 * 3600     # never ends during a run
+    if spawn_interval:
+        state.item_spawn_interval = spawn_interval
+
+    # 1. Desk full of items that keep bumping into each other
+    for _ in range(desk_items):
+        item = Item(random.choice(list(ITEM_DESCRIPTIONS.keys())))
+        item.set_position(random.randint(DESK_AREA['x'], DESK_AREA['x'] + DESK_AREA['width'] - 150),
+                          random.randint(DESK_AREA['y'], DESK_AREA['y'] + DESK_AREA['height'] - 150))
+        item.va = random.uniform(-3, 3)
+        state.inventory_manager.add_item_to_desk(item)
+
+    # 2. Every slot taken by a customer who is already waiting
+    for idx, slot_x in enumerate(CUSTOMER_SLOTS):
+        customer = Customer(random.choice(list(ITEM_DESCRIPTIONS.keys())), slot_x)
+        customer.max_wait_time = float('inf')
+        customer.y = customer.target_y
+        state.customer_slots[idx] = customer
+        state.customers.append(customer)
+    return state
+
+
+def run_scene(game_manager, frames, dt=1 / FPS):
+    """Run frames and return a dict of timings in milliseconds"""
+    update_times, render_times = [], []
+    for _ in range(frames):
+        start = time.perf_counter()
+        game_manager._update(dt)
+        mid = time.perf_counter()
+        game_manager._render()
+        end = time.perf_counter()
+        if game_manager.render_thread:
+            game_manager.render_thread.record_main(start, end)
+            # paced like clock.tick(FPS), a spinning main thread would starve the render thread
+            time.sleep(max(0.0, dt - (end - start)))
+        update_times.append((mid - start) * 1000)
+        render_times.append((end - mid) * 1000)
+
+    frame_times = sorted(u + r for u, r in zip(update_times, render_times))
+    return {
+        'update': statistics.mean(update_times),
+        'render': statistics.mean(render_times),
+        'frame': statistics.mean(frame_times),
+        'p95': frame_times[int(len(frame_times) * 0.95) - 1],
+    }
+
+
+def parse_size(text):
+    """'800x450' -> (800, 450)"""
+    width, height = text.split('x')
+    return int(width), int(height)
+
+
+def current_rss():
+    """Resident set size of this process in bytes (Linux), or 0 if unknown"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError):
+        return 0
+
+
+def reset_assets(convert_surfaces=CONVERT_SURFACES, quality=ASSET_QUALITY):
+    """Drop every cached surface so the next scene loads with the given settings"""
+    asset_manager.clear()
+    asset_manager.convert_surfaces = convert_surfaces
+    asset_manager.quality = quality
+    Item.clear_rotation_cache()
+    asset_manager.warm_up()
+
+
+def print_report(rows):
+    """rows: (label, timings) pairs"""
+    print(f"{'scene':<22}{'update':>10}{'render':>10}{'frame':>10}{'p95':>10}"
+          f"{'surfaces':>12}{'rss':>10}  (ms / MB)")
+    for label, t in rows:
+        print(f"{label:<22}{t['update']:>10.2f}{t['render']:>10.2f}{t['frame']:>10.2f}{t['p95']:>10.2f}"
+              f"{t['surface_bytes'] / 2**20:>12.1f}{t['rss'] / 2**20:>10.1f}")
+    if len(rows) == 2:
+        before, after = rows[0][1]['frame'], rows[1][1]['frame']
+        print(f"frame time change: {(after - before) / before * 100:+.1f}%")
+
+
+def main():
+    """benchmark entry point"""
+    frames = get_arg('--frames', 600)
+    game_manager = GameManager()
+
+    if '--compare-convert' in sys.argv:
+        variants = [('no convert', {'convert_surfaces': False}),
+                    ('convert', {'convert_surfaces': True})]
+    elif '--compare-dirty' in sys.argv:
+        variants = [('full flip', {'dirty_rects': False}),
+                    ('dirty rects', {'dirty_rects': True})]
+    elif '--compare-res' in sys.argv:
+        variants = [(f'render {w}x{h}', {'render_resolution': (w, h)})
+                    for w, h in ((WINDOW_WIDTH, WINDOW_HEIGHT), (WINDOW_WIDTH * 3 // 4, WINDOW_HEIGHT * 3 // 4),
+                                 (WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2))]
+    elif '--compare-backends' in sys.argv:
+        variants = [('surface blits', {'backend': 'surface'}),
+                    ('sdl2 textures', {'backend': 'sdl2'})]
+    elif '--compare-thread' in sys.argv:
+        variants = [('serial', {'render_thread': False}),
+                    ('render thread', {'render_thread': True})]
+    elif '--compare-tiers' in sys.argv:
+        variants = [(f'tier {tier}', {'quality': tier}) for tier in ('full', 'half', 'palettized')]
+    else:
+        tier = get_arg('--tier', ASSET_QUALITY)
+        variants = [(f'tier {tier}', {'quality': tier})]
+
+    render_resolution = RENDER_RESOLUTION
+    if '--render-res' in sys.argv:
+        render_resolution = parse_size(get_arg('--render-res', ''))
+
+    rows = []
+    for label, options in variants:
+        dirty_rects = options.pop('dirty_rects', DIRTY_RECTS)
+        game_manager.dirty_renderer = DirtyRectRenderer() if dirty_rects else None
+        game_manager.set_render_resolution(options.pop('render_resolution', render_resolution))
+        game_manager.set_backend(options.pop('backend', get_arg('--backend', RENDER_BACKEND)))
+        if options.pop('render_thread', '--render-thread' in sys.argv):
+            game_manager.start_render_thread()
+        reset_assets(**options)
+        build_scene(game_manager, desk_items=get_arg('--desk-items', 30),
+                    spawn_interval=get_arg('--spawn-interval', 0.0))
+        timings = run_scene(game_manager, frames)
+        if game_manager.render_thread:
+            game_manager.render_thread.wait_idle()
+            thread = game_manager.render_thread.stats()
+            game_manager.stop_render_thread()
+            print(f"{label}: {thread['drawn']}/{thread['published']} frames drawn "
+                  f"({thread['presented']} presented on the main thread), "
+                  f"{thread['render_ms']:.2f} ms per drawn frame, "
+                  f"{thread['overlap_ms']:.2f} ms of it ({thread['overlap']:.0%}) overlapping the main thread")
+        if game_manager.dirty_renderer:
+            dirty = game_manager.dirty_renderer.stats()
+            print(f"{label}: {dirty['full_frames']}/{dirty['frames']} full frames, "
+                  f"{dirty['avg_presented']:.1%} of the screen presented per frame")
+        # rss is process wide, so with several variants it includes earlier runs
+        timings['surface_bytes'] = asset_manager.resident_bytes()
+        timings['rss'] = current_rss()
+        rows.append((label, timings))
+    print_report(rows)
+    frame = game_manager.draw_list.stats()
+    print(f"draw list: {frame['blits']} blits in {frame['batches']} batches, {frame['calls']} draw calls, "
+          f"{frame['layers']} layers in the last frame")
+    if game_manager.texture_backend:
+        textures = game_manager.texture_backend.stats()
+        print(f"sdl2 backend: {'hardware' if textures['accelerated'] else 'software'} renderer, "
+              f"{textures['textures']} textures, {textures['uploads']} uploads")
+    culled = game_manager.states[GameState.GAMEPLAY].culler.stats()
+    print(f"culling: {culled['culled']} of {culled['drawn'] + culled['culled']} draws skipped in the last frame")
+    shadows = Item.shadow_stats()
+    print(f"shadow cache: {shadows['entries']} sprites, {shadows['hits']} hits, {shadows['misses']} misses")
+    text = text_cache.stats()
+    print(f"text cache: {text['entries']} surfaces, hit rate {text['hit_rate']:.1%} "
+          f"(last frame {text['frame_hits']}/{text['frame_hits'] + text['frame_misses']})")
+
+
+if __name__ == "__main__":
+    main()
@@ -22,6 +22,47 @@ COLOR_ORANGE = (255, 165, 0)
 # Font
 FONT_PATH = 'assets/fonts/game_font.ttf'
 
+# Asset cache
+ASSET_CACHE_BUDGET = 64 * 1024 * 1024   # bytes kept by the AssetManager before LRU eviction
+TEXT_CACHE_SIZE = 256                   # rendered text surfaces kept before LRU eviction
+POPUP_LIMIT = 12                        # floating texts alive at once, bursts recycle the oldest
+NPC_SIZE = (375, 470)   # NPC sprite size on screen
+CONVERT_SURFACES = True     # convert loaded surfaces to the display pixel format
+# Asset quality tier for constrained kiosks:
+#   'full'       - 32-bit surfaces, every background stays resident
+#   'half'       - opaque images stored as 16-bit, NPC sprites at half resolution,
+#                  backgrounds of inactive states released
+#   'palettized' - opaque images stored as 8-bit palettized, NPC sprites at half resolution,
+#                  inactive backgrounds released
+ASSET_QUALITY = 'full'
+NPC_FULL_SIZE_COPIES = 5    # full-size NPC sprites cached by the low tiers (3 customer slots + thief + police)
+USE_TEXTURE_ATLAS = True    # pack item and NPC sprites into shared atlas pages
+ATLAS_PAGE_SIZE = 2048      # atlas page width / max height in pixels
+SPRITE_CACHE_PATH = 'assets/cache/sprites.bin'   # written by bake_assets.py
+USE_SPRITE_CACHE = True     # read pre-scaled sprites from the baked file when present
+PRELOAD_WORKERS = 4         # threads decoding assets on the loading screen
+PRELOAD_FRAME_BUDGET = 0.008    # seconds per frame spent turning decoded buffers into surfaces
+
+# Rendering
+RENDER_RESOLUTION = (WINDOW_WIDTH, WINDOW_HEIGHT)   # internal resolution, e.g. (800, 450) on weak machines
+OUTPUT_SCALING = 'scaled'       # 'scaled' (pygame.SCALED) or 'software', used when RENDER_RESOLUTION differs
+FULLSCREEN = False
+SCALE_CACHE_SIZE = 512          # sprites kept pre-scaled to the render resolution
+RENDER_BACKEND = 'surface'      # 'surface' (blits) or 'sdl2' (pygame._sdl2 textures, python start.py --sdl2)
+TEXTURE_CACHE_SIZE = 512        # surfaces kept uploaded as textures by the sdl2 backend
+RENDER_THREAD = False           # opt-in: draw on a render thread (python start.py --render-thread)
+DIRTY_RECTS = False             # opt-in: present only changed regions (python start.py --dirty-rects)
+DIRTY_RECT_MAX_AREA = 0.5       # dirty share of the screen above which a full flip is cheaper
+DIRTY_RECT_MAX_RECTS = 8        # rects per display.update() before dirty rects are merged further
+DRAG_SCALE = 1.2                # dragged item preview size
+DRAG_SHADOW_OFFSET = (20, 20)   # dragged item shadow offset
+SHADOW_ALPHA = 100              # item drop shadow opacity
+
+# UI element sizes
+CURSOR_SIZE = (45, 45)
+HUD_ICON_SIZE = (130, 80)
+SPRAY_BUTTON_SIZE = (50, 150)
+
 SOUNDS = {
     # BGM
     'bgm_menu': 'assets/sounds/bgm_menu.ogg',
@@ -36,6 +77,17 @@ SOUNDS = {
     'sfx_spray': 'assets/sounds/sfx_spray.wav',
 }
 
+# Audio: SFX name -> (volume, max plays at once); each play slot is a reserved channel
+SFX_SETTINGS = {
+    'sfx_money': (1.0, 2),
+    'sfx_deny': (0.6, 2),
+    'sfx_click': (0.8, 2),
+    'sfx_pick': (0.8, 1),
+    'sfx_drop': (0.2, 2),
+    'sfx_spray': (1.0, 3),
+}
+FREE_SFX_CHANNELS = 4   # unreserved channels left for plain Sound.play() (music has no channel)
+
 # Game parameters
 # NPC setting
 CUSTOMER_INTERVAL = 5.0      # NPC spawn interval
@@ -55,6 +107,7 @@ ITEM_VERTICAL_OFFSETS = [30, 0, -30]
 CONVEYOR_PAUSE_AT_INDEX = 2
 ITEM_SIZE = (100, 100)  # default item size
 ITEM_GRID_SIZE = 130    # default grid size
+ITEM_ROTATION_STEP = 2  # degrees, rotated sprites are cached per step
 
 # Area setting
 CONVEYOR_AREA = {'x': 40, 'y': 0, 'width': 200, 'height': 900}
@@ -66,6 +119,7 @@ CONVEYOR_PAUSE_DURATION = 12.0
 CONVEYOR_PAUSE_TRIGGER_Y = 270
 CONVEYOR_CENTER_X = 140      # Set center_x
 CONVEYOR_WIDTH = 180         # Set width
+CONVEYOR_LANES = [CONVEYOR_CENTER_X]    # center x of every drawn belt lane (one shared strip)
 
 # Money
 REWARD_CORRECT = 100
@@ -82,8 +136,13 @@ ASSETS = {
     'bg_menu': 'assets/images/background_menu.png',
     'bg_game_over': 'assets/images/background_game_over.png',
     'conveyor_belt': 'assets/images/conveyor_belt.png',
+    'bubble_box': 'assets/images/icons/bubble_box.png',
+    'icon_clock': 'assets/images/icons/clock.png',
+    'icon_money': 'assets/images/icons/money.png',
+    'icon_label': 'assets/images/icons/label.png',
     # NPC
     'thief': 'assets/images/thief.png',
+    'police': 'assets/images/police.png',
     'item_spray': 'assets/images/icons/spray.png',
     'npc_1': 'assets/images/npc_1.png',
     'npc_2': 'assets/images/npc_2.png',
@@ -8,11 +8,19 @@ import pygame
 import random
 from config.settings import *
 from game.ui.button import Button
+from game.managers.asset_manager import asset_manager
+from game.managers.text_cache import text_cache
+from game.render.draw_list import DrawList, NPCS
+from game.render.viewport import viewport
 
 
 class Customer:
     """Customer NPC who requests a specific item type and waits at the counter."""
 
+    DIALOG_SIZE = (268, 135)
+    DIALOG_Y = 205
+    PATIENCE_BAR = (45, 100, 168, 10)   # x, y, width, height inside the dialog panel
+
     def __init__(self, sought_item_type, target_x=WINDOW_WIDTH//2):
         """
         Initialize a customer who is looking for a specific item type.
@@ -48,12 +56,15 @@ class Customer:
         self.bubble_image = None
         self._load_resources()
 
-        # Dialog is shown after arrival
+        # Dialog is shown after arrival; the panel is rebuilt when description changes
         self.dialog_visible = False
+        self._dialog_panel = None
+        self._dialog_text = None
 
         # Fonts
-        self.font = pygame.font.Font(FONT_PATH, 24)
-        self.font_small = pygame.font.Font(FONT_PATH, 20)
+        self.font_size = 24
+        self.font = asset_manager.font(FONT_PATH, self.font_size)    # for measuring lines
+        self.font_small = asset_manager.font(FONT_PATH, 20)
 
         # "Don't Have" button (click handling is done in GameplayState)
         # The position is updated dynamically in update().
@@ -110,8 +121,7 @@ class Customer:
             if not path:
                 raise KeyError(f"Missing ASSETS key: {image_key}")  # force fallback
 
-            img = pygame.image.load(path)
-            self.image = pygame.transform.scale(img, (375, 470))
+            self.image = asset_manager.image(path, NPC_SIZE)
         except Exception:
             self.image = pygame.Surface((100, 100))
             self.image.fill((150, 150, 200))
@@ -119,7 +129,7 @@ class Customer:
 
         # 2) Load bubble frame; if it fails, render() will draw a basic bubble
         try:
-            self.bubble_image = pygame.image.load('assets/images/icons/bubble_box.png')
+            self.bubble_image = asset_manager.image(ASSETS['bubble_box'])
         except Exception:
             self.bubble_image = None
 
@@ -155,7 +165,7 @@ class Customer:
             btn_y = bubble_bottom_y + 5
 
             self.reject_button.rect.topleft = (btn_x, btn_y)
-            self.reject_button.update(pygame.mouse.get_pos())
+            self.reject_button.update(viewport.mouse_pos())
 
     def is_timeout(self):
         """Return True if the customer has waited too long."""
@@ -181,85 +191,96 @@ class Customer:
         Args:
             screen (pygame.Surface): The game screen surface to draw on.
         """
-        # 1) Draw customer sprite
+        draw_list = DrawList()
+        self.submit(draw_list, NPCS)
+        draw_list.flush(screen)
+
+    def submit(self, draw_list, layer):
+        """
+        Queue the customer on a frame draw list (sprite, dialog, patience bar, button).
+
+        Args:
+            draw_list (DrawList): Frame draw list
+            layer (int): Draw list layer
+        """
+        # 1) Customer sprite
         if self.image:
-            image_rect = self.image.get_rect(center=(self.x, self.y))
-            screen.blit(self.image, image_rect)
+            draw_list.add(layer, self.image, self.image.get_rect(center=(self.x, self.y)))
 
-        # 2) Draw dialog UI (if active)
+        # 2) Dialog UI (if active): cached panel + patience fill
         if self.dialog_visible:
-            dialog_width = 268
-            dialog_height = 135
+            if self._dialog_text != self.description:
+                self._build_dialog_panel()
+            dialog_width, dialog_height = self.DIALOG_SIZE
             dialog_x = self.x - dialog_width // 2
-            dialog_y = 205
-
-            # Bubble background (image preferred, rectangle fallback)
-            # - If bubble image exists, blit it.
-            # - Otherwise, fallback to a simple rounded rectangle
-            if self.bubble_image:
-                bubble_scaled = pygame.transform.scale(
-                    self.bubble_image,
-                    (dialog_width, dialog_height)
-                )
-                screen.blit(bubble_scaled, (dialog_x, dialog_y))
-            else:
-                pygame.draw.rect(
-                    screen, COLOR_WHITE,
-                    (dialog_x, dialog_y, dialog_width, dialog_height),
-                    border_radius=10
-                )
-                pygame.draw.rect(
-                    screen, COLOR_BLACK,
-                    (dialog_x, dialog_y, dialog_width, dialog_height),
-                    2,
-                    border_radius=10
-                )
-
-            # Render wrapped dialog text (centered)
-            lines = self._wrap_text(
-                self.description,
-                self.font,
-                dialog_width - 30
-            )
-            line_height = 25
-            total_text_height = len(lines) * line_height
-            content_area_height = dialog_height - 30
-            text_start_y = (
-                dialog_y
-                + (content_area_height - total_text_height) // 2
-                + 5
-            )
+            dialog_y = self.DIALOG_Y
+            draw_list.add(layer, self._dialog_panel, (dialog_x, dialog_y))
 
-            for i, line in enumerate(lines):
-                text = self.font.render(line, True, COLOR_BLACK)
-                text_rect = text.get_rect(
-                    centerx=dialog_x + dialog_width // 2,
-                    top=text_start_y + i * line_height
-                )
-                screen.blit(text, text_rect)
-
-            # Patience bar (background + fill)
-            bar_w = dialog_width - 100
-            bar_x = dialog_x + 45
-            bar_y = dialog_y + dialog_height - 35
-
-            pygame.draw.rect(
-                screen,
-                COLOR_DARK_GRAY,
-                (bar_x, bar_y, bar_w, 10),
-                border_radius=4
-            )
-            fill = int(bar_w * self.patience)
+            # Patience bar fill (the empty bar is part of the panel)
+            bar_x, bar_y, _, bar_h = self.PATIENCE_BAR
+            fill = self._patience_fill()
             if fill > 0:
-                pygame.draw.rect(
-                    screen,
-                    self.get_patience_color(),
-                    (bar_x, bar_y, fill, 10),
-                    border_radius=4
-                )
+                draw_list.add_rect(layer, self.get_patience_color(),
+                                   (dialog_x + bar_x, dialog_y + bar_y, fill, bar_h), border_radius=4)
 
             # "Don't Have" button
-            self.reject_button.render(screen)
+            self.reject_button.submit(draw_list, layer)
+
+    def _patience_fill(self):
+        """Width in pixels of the filled part of the patience bar"""
+        return int(self.PATIENCE_BAR[2] * self.patience)
+
+    def dirty_region(self):
+        """
+        Screen rect covered by sprite, dialog and button, plus a value that changes
+        whenever those pixels do (used by the dirty rect renderer).
+        """
+        rect = self.image.get_rect(center=(self.x, self.y)) if self.image else pygame.Rect(self.x, self.y, 0, 0)
+        if self.dialog_visible:
+            dialog_width, dialog_height = self.DIALOG_SIZE
+            rect.union_ip((self.x - dialog_width // 2, self.DIALOG_Y, dialog_width, dialog_height))
+            # thief / police park the button off screen
+            if self.reject_button.rect.colliderect((0, 0, WINDOW_WIDTH, WINDOW_HEIGHT)):
+                rect.union_ip(self.reject_button.rect)
+        look = (id(self.image), self.dialog_visible, self.description,
+                self._patience_fill(), self.get_patience_color(), self.reject_button.is_hovered)
+        return rect, look
+
+    def _build_dialog_panel(self):
+        """
+        Composite bubble, wrapped text and empty patience bar into one surface.
+        Called again only when self.description changes.
+        """
+        dialog_width, dialog_height = self.DIALOG_SIZE
+        panel = pygame.Surface(self.DIALOG_SIZE, pygame.SRCALPHA)
+
+        # Bubble background (image preferred, rectangle fallback)
+        if self.bubble_image:
+            panel.blit(pygame.transform.scale(self.bubble_image, self.DIALOG_SIZE), (0, 0))
+        else:
+            pygame.draw.rect(panel, COLOR_WHITE, panel.get_rect(), border_radius=10)
+            pygame.draw.rect(panel, COLOR_BLACK, panel.get_rect(), 2, border_radius=10)
+
+        # Wrapped dialog text (centered)
+        lines = self._wrap_text(self.description, self.font, dialog_width - 30)
+        line_height = 25
+        total_text_height = len(lines) * line_height
+        content_area_height = dialog_height - 30
+        text_start_y = (content_area_height - total_text_height) // 2 + 5
+
+        for i, line in enumerate(lines):
+            text = text_cache.render(FONT_PATH, self.font_size, line, COLOR_BLACK)
+            text_rect = text.get_rect(
+                centerx=dialog_width // 2,
+                top=text_start_y + i * line_height
+            )
+            panel.blit(text, text_rect)
+
+        # Empty patience bar
+        pygame.draw.rect(panel, COLOR_DARK_GRAY, self.PATIENCE_BAR, border_radius=4)
+
+        self._dialog_panel = asset_manager.prepare_surface(panel)
+        self._dialog_text = self.description
 
     def _wrap_text(self, text, font, max_width):
         """Wrap text into multiple lines so each line fits within max_width."""
@@ -4,11 +4,20 @@
 
 import pygame
 import random
-from config.settings import ITEM_SIZE, ITEM_DESCRIPTIONS, ASSETS, COLOR_WHITE
+from config.settings import ITEM_SIZE, ITEM_DESCRIPTIONS, ASSETS, COLOR_WHITE, ITEM_ROTATION_STEP, SHADOW_ALPHA
+from game.managers.asset_manager import asset_manager
 
 class Item:
     """物品类"""
 
+    # rotated sprites shared by every item of the same type
+    # item_type -> {angle bucket: (rotated image, rect at origin)}
+    _rotation_cache = {}
+    # drop shadows, (item_type, angle bucket, scale) -> surface; counters for profiling
+    _shadow_cache = {}
+    shadow_hits = 0
+    shadow_misses = 0
+
     def __init__(self, item_type):
         # property of each item
         ### in this part, mainly get the information of the input and seperate them into different variables
@@ -70,21 +79,20 @@ class Item:
             # else raise not found
             if image_key in ASSETS:
                 image_path = ASSETS[image_key]
-                self.original_image = pygame.image.load(image_path)
-                # transform the input image's size, following the size of width and height
-                self.original_image = pygame.transform.scale(self.original_image, (self.width, self.height))
+                # shared sprite, already scaled to (width, height) by the asset manager
+                self.original_image = asset_manager.image(image_path, (self.width, self.height))
             else:
                 raise Exception("Image key not found")
         except Exception as e:
             # if previous progress not working, then create a label for that
             self.original_image = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
             self.original_image.fill((100, 100, 200))
-            font = pygame.font.Font(None, 16)
+            font = asset_manager.font(None, 16)
             text = font.render(self.item_type[:8], True, COLOR_WHITE)
             text_rect = text.get_rect(center=(self.width//2, self.height//2))
             self.original_image.blit(text, text_rect)
 
-        self.image = self.original_image.copy()
+        self.image = self.original_image
         # rect: rectangle object
         self.rect = self.image.get_rect(topleft=(self.x, self.y))
 
@@ -108,19 +116,71 @@ class Item:
     def rotate(self, angle_change=0):
         # change the angle based on existed angle
         self.angle = (self.angle + angle_change) % 360
-        self.image = pygame.transform.rotate(self.original_image, self.angle)
+        self.image, image_rect = self._get_rotated_image(self.angle)
 
         if self.rect:
             # change the value of rect
             old_center = self.rect.center
             # center not in get_rect function but as long as it is rect it has rect
-            self.rect = self.image.get_rect(center=old_center)
+            self.rect = image_rect.copy()
+            self.rect.center = old_center
             self.x = self.rect.x
             self.y = self.rect.y
             self.width = self.rect.width
             self.height = self.rect.height
         else:
-            self.rect = self.image.get_rect(topleft=(self.x, self.y))
+            self.rect = image_rect.copy()
+            self.rect.topleft = (self.x, self.y)
+
+    @property
+    def rotation_bucket(self):
+        # index of the quantized angle, same value -> same cached sprite
+        return self._angle_bucket(self.angle)
+
+    @staticmethod
+    def _angle_bucket(angle):
+        return round(angle / ITEM_ROTATION_STEP) % round(360 / ITEM_ROTATION_STEP)
+
+    def _get_rotated_image(self, angle):
+        # look up the rotated sprite for this type, render it only on the first use
+        cache = Item._rotation_cache.setdefault(self.item_type, {})
+        bucket = self._angle_bucket(angle)
+        entry = cache.get(bucket)
+        if entry is None:
+            image = pygame.transform.rotate(self.original_image, bucket * ITEM_ROTATION_STEP)
+            entry = (image, image.get_rect())
+            cache[bucket] = entry
+        return entry
+
+    @classmethod
+    def clear_rotation_cache(cls):
+        # drop every cached rotated sprite and shadow (e.g. after the asset quality changes)
+        cls._rotation_cache.clear()
+        cls._shadow_cache.clear()
+
+    def get_shadow(self, scale=1.0):
+        # shadow of the current sprite, built once per type / rotation / scale
+        key = (self.item_type, self.rotation_bucket, scale)
+        shadow = Item._shadow_cache.get(key)
+        if shadow is not None:
+            Item.shadow_hits += 1
+            return shadow
+        Item.shadow_misses += 1
+        shadow = self._make_shadow(scale)
+        Item._shadow_cache[key] = shadow
+        return shadow
+
+    def _make_shadow(self, scale):
+        # flat black silhouette with per-pixel alpha (surface alpha + RLE broke clipped blits)
+        image = self.image
+        if scale != 1.0:
+            image = pygame.transform.scale(image, (int(image.get_width() * scale), int(image.get_height() * scale)))
+        shadow = pygame.mask.from_surface(image).to_surface(setcolor=(0, 0, 0, SHADOW_ALPHA), unsetcolor=None)
+        return asset_manager.prepare_surface(shadow)
+
+    @classmethod
+    def shadow_stats(cls):
+        return {'entries': len(cls._shadow_cache), 'hits': cls.shadow_hits, 'misses': cls.shadow_misses}
 
     def update_physics(self, dt):
         # update the physics status
@@ -206,5 +266,20 @@ class Item:
             sel_rect = self.rect if self.rect else pygame.Rect(self.x, self.y, self.width, self.height)
             pygame.draw.rect(screen, (255, 255, 0), sel_rect, 3)
 
+    def submit(self, draw_list, layer):
+        # same as render(), queued on a frame draw list (see game/render/draw_list.py);
+        # backends with transforms rotate the original image themselves
+        if self.image and draw_list.transforms:
+            draw_list.add_sprite(layer, self.original_image, self.get_rect().center, self.angle)
+        elif self.image:
+            draw_list.add(layer, self.image, self.rect if self.rect else (self.x, self.y))
+        if self.is_selected:
+            sel_rect = self.rect if self.rect else pygame.Rect(self.x, self.y, self.width, self.height)
+            draw_list.add_rect(layer, (255, 255, 0), sel_rect, 3)
+
+    def dirty_region(self):
+        # screen rect this item covers and a value that changes with its pixels (dirty rect renderer)
+        return pygame.Rect(self.get_rect()), (id(self.image), self.is_selected)
+
     def __repr__(self):
         return f"Item({self.item_type})"
\ No newline at end of file
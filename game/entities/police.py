@@ -6,7 +6,8 @@ then deliver the matching evidence item. Police cannot be dismissed.
 
 import pygame
 from game.entities.customer import Customer
-from config.settings import ASSETS, WINDOW_WIDTH
+from config.settings import ASSETS, NPC_SIZE, WINDOW_WIDTH
+from game.managers.asset_manager import asset_manager
 
 
 class Police(Customer):
@@ -38,8 +39,7 @@ class Police(Customer):
         try:
             # fallback path if key missing
             path = ASSETS.get('police', 'assets/images/police.png')  
-            img = pygame.image.load(path)
-            self.image = pygame.transform.scale(img, (375, 470))
+            self.image = asset_manager.image(path, NPC_SIZE)
         except Exception:
             self.image = pygame.Surface((100, 100))  # placeholder sprite
             self.image.fill((100, 100, 100))
@@ -48,7 +48,7 @@ class Police(Customer):
         # bubble image is optional; if it fails, 
         # Customer.render() will draw a basic bubble
         try:
-            self.bubble_image = pygame.image.load('assets/images/icons/bubble_box.png')
+            self.bubble_image = asset_manager.image(ASSETS['bubble_box'])
         except Exception:
             self.bubble_image = None
 
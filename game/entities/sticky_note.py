@@ -8,12 +8,17 @@ import pygame
 import random
 from config.settings import *
 from game.entities.item import Item
+from game.managers.asset_manager import asset_manager
+from game.managers.text_cache import text_cache
 from config.settings import COLOR_BLACK, ITEM_DESCRIPTIONS  # TODO 12.07 REVISE
 
 
 class StickyNote(Item):
     """Case note item: static paper that stores the case target info."""
 
+    # (width, height) -> blank note with the CASE label, copied for every note
+    _templates = {}
+
     def __init__(self, x, y, sought_item_type):
         # Basic identity
         self.item_type = 'sticky_note'
@@ -72,24 +77,36 @@ class StickyNote(Item):
         return random.choice(candidates)
 
     def _generate_image(self):
-        """Generate a simple sticky note surface (no rotation)."""
-        # final image surface
-        self.image = pygame.Surface((self.width, self.height))  
-        self.image.fill(COLOR_YELLOW)  # yellow paper background
-
-        # Red "CASE" stamp label (top-left)
-        font_small = pygame.font.SysFont(FONT_PATH, 16, bold=True)
-        pygame.draw.rect(self.image, COLOR_RED, (5, 5, 40, 15))
-        lbl = font_small.render("CASE", True, COLOR_WHITE)
-        self.image.blit(lbl, (8, 6))
+        """Stamp case ID and clue onto a copy of the shared note template (no rotation)."""
+        self.image = StickyNote._get_template(self.width, self.height).copy()
 
         # Case ID
-        font_id = pygame.font.SysFont(FONT_PATH, 16, bold=True)
-        id_text = font_id.render(f"ID: {self.case_id}", True, COLOR_BLACK)
+        id_text = text_cache.render(None, 16, f"ID: {self.case_id}", COLOR_BLACK, bold=True)
         self.image.blit(id_text, (10, 25))
 
-        font_clue = pygame.font.SysFont(FONT_PATH, 16)
-
-        text = font_clue.render(self.clue_text, True, COLOR_BLACK)
+        text = text_cache.render(None, 16, self.clue_text, COLOR_BLACK)
         text_rect = text.get_rect(center=(self.width // 2, self.height // 2 + 15))
-        self.image.blit(text, text_rect)
\ No newline at end of file
+        self.image.blit(text, text_rect)
+        # unrotated source for backends that rotate sprites themselves (notes never rotate)
+        self.original_image = self.image
+
+    @classmethod
+    def _get_template(cls, width, height):
+        """Yellow paper with the red CASE label, drawn once per note size."""
+        template = cls._templates.get((width, height))
+        if template is None:
+            template = pygame.Surface((width, height))
+            template.fill(COLOR_YELLOW)  # yellow paper background
+
+            # Red "CASE" stamp label (top-left)
+            pygame.draw.rect(template, COLOR_RED, (5, 5, 40, 15))
+            lbl = text_cache.render(None, 16, "CASE", COLOR_WHITE, bold=True)
+            template.blit(lbl, (8, 6))
+
+            # fully opaque paper: plain convert() to the display format
+            template = asset_manager.prepare_surface(template)
+            cls._templates[(width, height)] = template
+        return template
+
+    def rotate(self, angle_change=0):
+        """Notes stay upright (each note has its own image, so no shared rotation cache)"""
@@ -2,7 +2,8 @@
 import pygame
 import random
 from game.entities.customer import Customer
-from config.settings import ASSETS, THIEF_WAIT_TIME, THIEF_HP, COLOR_RED
+from config.settings import ASSETS, NPC_SIZE, THIEF_WAIT_TIME, THIEF_HP, COLOR_RED
+from game.managers.asset_manager import asset_manager
 
 
 class Thief(Customer):
@@ -46,8 +47,7 @@ class Thief(Customer):
         """Load img"""
         try:
             path = ASSETS.get('thief', 'assets/images/thief.png')
-            img = pygame.image.load(path)
-            self.image = pygame.transform.scale(img, (375, 470))
+            self.image = asset_manager.image(path, NPC_SIZE)
         except Exception as e:
             print(f"Failed to load the conveyor belt image: {e}")
 
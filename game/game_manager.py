@@ -1,31 +1,72 @@
+import importlib
+import time
 import pygame
 import sys
-from game.states.menu_state import MenuState
-from game.states.gameplay_state import GameplayState
-from game.states.game_over_state import GameOverState
 from config.settings import *
+from game.managers.asset_manager import asset_manager
+from game.managers.text_cache import text_cache
+from game.render.dirty_rects import DirtyRectRenderer
+from game.render.draw_list import DrawList, CURSOR
+from game.render.viewport import viewport
+from game.render.texture_backend import TextureBackend
+from game.render.render_thread import RenderThread
 
 class GameState:
+    LOADING = 'loading'
     MENU = 'menu'
     GAMEPLAY = 'gameplay'
     GAME_OVER = 'game_over'
 
+# State modules are imported on first use, so startup only pays for the loading screen
+STATE_CLASSES = {
+    GameState.LOADING: ('game.states.loading_state', 'LoadingState'),
+    GameState.MENU: ('game.states.menu_state', 'MenuState'),
+    GameState.GAMEPLAY: ('game.states.gameplay_state', 'GameplayState'),
+    GameState.GAME_OVER: ('game.states.game_over_state', 'GameOverState'),
+}
+
 class GameManager:
-    def __init__(self):
-        pygame.init()
-        # [修改] 确保使用 settings 中的宽高
-        self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+    def __init__(self, exit_when_interactive=False, dirty_rects=DIRTY_RECTS, render_resolution=RENDER_RESOLUTION,
+                 backend=RENDER_BACKEND, render_thread=RENDER_THREAD):
+        """
+        Args:
+            exit_when_interactive (bool): Stop the loop after the first menu frame
+                (used by start.py --measure-startup)
+            dirty_rects (bool): Present only changed screen regions where the
+                state supports it (see game/render/dirty_rects.py)
+            render_resolution (tuple): Internal resolution frames are rendered at,
+                scaled to the window (see game/render/viewport.py)
+            backend (str): 'surface' (blits) or 'sdl2' (textures, see
+                game/render/texture_backend.py), falls back to 'surface'
+            render_thread (bool): Draw frames on a render thread while the main thread
+                simulates (see game/render/render_thread.py), falls back to the serial loop
+        """
+        # Startup timeline: (label, perf_counter) pairs, see mark_startup()
+        self.startup_marks = []
+        self.exit_when_interactive = exit_when_interactive
+        self.first_flip_done = False
+
+        # Only display and font are needed for the first frame, the mixer is
+        # opened later by audio_manager.ensure_mixer()
+        pygame.display.init()
+        pygame.font.init()
+        # [修改] 确保使用 settings 中的宽高 (game coordinates stay WINDOW_WIDTH x WINDOW_HEIGHT)
+        self.dirty_renderer = DirtyRectRenderer() if dirty_rects else None
+        self.draw_list = DrawList()     # frame draw list for states that submit()
+        self.texture_backend = None
+        self.set_backend(backend, render_resolution)
         pygame.display.set_caption(WINDOW_TITLE)
+        self.mark_startup('display init')
         self.clock = pygame.time.Clock()
         self.running = True
+        self.use_render_thread = render_thread
+        self.render_thread = None
 
         # 1. 隐藏系统默认光标
         pygame.mouse.set_visible(False)
         self.cursor_img = None
         try:
-            path = ASSETS['cursor']
-            self.cursor_img = pygame.image.load(path)
-            self.cursor_img = pygame.transform.scale(self.cursor_img, (45, 45))
+            self.cursor_img = asset_manager.image(ASSETS['cursor'], CURSOR_SIZE)
         except Exception as e:
             print(f"Failed to load custom cursor: {e}")
             pygame.mouse.set_visible(True)
@@ -35,45 +76,189 @@ class GameManager:
 
         self.game_data = {}
 
+        # 2. Assets are decoded in the background while the loading screen runs,
+        #    the loading state switches to the menu when it is done
         self._init_states()
-        self.change_state(GameState.MENU)
+        self.change_state(GameState.LOADING)
 
     def _init_states(self):
-        self.states[GameState.MENU] = MenuState(self)
+        self.states[GameState.LOADING] = self._create_state(GameState.LOADING)
+
+    def _create_state(self, state_name):
+        """Import the state module on demand and build the state"""
+        module_name, class_name = STATE_CLASSES[state_name]
+        state_class = getattr(importlib.import_module(module_name), class_name)
+        return state_class(self)
+
+    def mark_startup(self, label):
+        """Record a point on the startup timeline (only the first mark per label counts)"""
+        if all(name != label for name, _ in self.startup_marks):
+            self.startup_marks.append((label, time.perf_counter()))
 
     def change_state(self, state_name, **kwargs):
         """切换状态"""
         self.game_data.update(kwargs)
+        previous_state = self.states.get(self.current_state)
 
         if state_name == GameState.GAMEPLAY:
             # [修改] 移除 difficulty 参数，每次重新创建以重置游戏
-            self.states[GameState.GAMEPLAY] = GameplayState(self)
+            self.states[GameState.GAMEPLAY] = self._create_state(GameState.GAMEPLAY)
 
         elif state_name == GameState.GAME_OVER:
-            self.states[GameState.GAME_OVER] = GameOverState(self)
+            self.states[GameState.GAME_OVER] = self._create_state(GameState.GAME_OVER)
 
         elif state_name == GameState.MENU:
+            # the loading screen is only needed once
+            self.states.pop(GameState.LOADING, None)
             if GameState.MENU not in self.states:
-                self.states[GameState.MENU] = MenuState(self)
-            # 切换回菜单时播放音乐
-            try:
-                pygame.mixer.music.load('assets/sounds/bgm_menu.mp3')
-                pygame.mixer.music.play(-1)
-            except: pass
+                self.states[GameState.MENU] = self._create_state(GameState.MENU)
+            else:
+                # 切换回菜单时播放音乐 (a new MenuState starts it itself)
+                self.states[GameState.MENU].play_menu_music()
 
         self.current_state = state_name
+        self._swap_state_assets(previous_state, self.states.get(state_name))
+
+    def _swap_state_assets(self, previous_state, new_state):
+        """Low-memory tiers keep only the active state's background resident"""
+        if not asset_manager.releases_backgrounds or previous_state is new_state:
+            return
+        if previous_state is not None and hasattr(previous_state, 'release_assets'):
+            previous_state.release_assets()
+        if new_state is not None and hasattr(new_state, 'restore_assets'):
+            new_state.restore_assets()
 
     def run(self):
+        if self.use_render_thread:
+            self.start_render_thread()
         while self.running:
             dt = self.clock.tick(FPS) / 1000.0
+            start = time.perf_counter()
             self._handle_events()
             self._update(dt)
             self._render()
+            if self.render_thread:
+                self.render_thread.record_main(start, time.perf_counter())
+        self.stop_render_thread()
+
+    def start_render_thread(self):
+        """
+        Draw gameplay frames on a render thread from now on. The thread only
+        draws into self.screen; flip() / the SCALED renderer stay on this thread.
+        Stays serial with the texture backend (its renderer belongs to this thread)
+        and with dirty rects (they draw and present in one step).
+        """
+        if self.texture_backend or self.dirty_renderer:
+            print("Render thread needs the surface backend without dirty rects, using the serial loop")
+            return
+        self.render_thread = RenderThread(self._draw_snapshot)
+        self.render_thread.start()
+
+    def stop_render_thread(self):
+        """Wait for the frame in progress and go back to the serial loop"""
+        if self.render_thread:
+            self.render_thread.stop()
+            self.render_thread = None
+
+    def _draw_snapshot(self, snapshot):
+        """Render thread: draw one published frame (presented by _render() on the main thread)"""
+        self.draw_list.draw_entries(self.screen, snapshot)
+
+    def _publish_frame(self, state):
+        """Queue the frame and hand its snapshot to the render thread"""
+        self.draw_list.begin()
+        state.submit(self.screen, self.draw_list)
+        if self.cursor_img:
+            self.draw_list.add(CURSOR, self.cursor_img, viewport.mouse_pos())
+        self.render_thread.publish(self.draw_list.snapshot())
+
+    def set_render_resolution(self, render_resolution, scaling=OUTPUT_SCALING):
+        """
+        (Re)open the display rendering at render_resolution.
+
+        Args:
+            render_resolution (tuple): Internal resolution, same aspect ratio as the window
+            scaling (str): 'scaled' or 'software', see game/render/viewport.py
+        """
+        self.screen = viewport.open(render_resolution, scaling)
+        self.draw_list.set_scale(viewport.scale)
+        if self.dirty_renderer:
+            self.dirty_renderer.scale = viewport.scale
+            self.dirty_renderer.invalidate()
+
+    def set_backend(self, backend, render_resolution=RENDER_RESOLUTION):
+        """
+        Switch between blitting surfaces and the SDL2 texture backend.
+
+        Args:
+            backend (str): 'surface' or 'sdl2'
+            render_resolution (tuple): Used if the display has to be opened
+                for surface blits (first call, or sdl2 failed to start)
+        """
+        if self.texture_backend:
+            self.texture_backend.close()
+            self.texture_backend = None
+        if backend == 'sdl2':
+            try:
+                self.texture_backend = TextureBackend((WINDOW_WIDTH, WINDOW_HEIGHT), WINDOW_TITLE)
+            except Exception as e:
+                print(f"Failed to start the sdl2 backend, using surface blits: {e}")
+        self.draw_list.transforms = self.texture_backend is not None
+
+        if self.texture_backend:
+            # logical-size canvas for screens drawn without a draw list (and for culling)
+            self.screen = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+            self.draw_list.set_scale(1.0)
+        elif viewport.screen is None:
+            self.set_render_resolution(render_resolution)
+        else:
+            self.screen = viewport.screen
+            self.draw_list.set_scale(viewport.scale)
+
+    def _draw_textured(self, state):
+        """Draw and show a frame with the texture backend"""
+        if hasattr(state, 'submit'):
+            self.draw_list.begin()
+            state.submit(self.screen, self.draw_list)
+            if self.cursor_img:
+                self.draw_list.add(CURSOR, self.cursor_img, viewport.mouse_pos())
+            self.texture_backend.present(self.draw_list)
+            return
+
+        if state is not None:
+            state.render(self.screen)
+        if self.cursor_img:
+            self.screen.blit(self.cursor_img, viewport.mouse_pos())
+        self.texture_backend.present_surface(self.screen)
+
+    def _draw_frame(self, screen):
+        """Draw the current state and the cursor"""
+        state = self.states.get(self.current_state)
+        # States with submit() queue into the draw list (scaled to the render
+        # resolution when it is flushed), the cursor goes on its top layer
+        if hasattr(state, 'submit'):
+            self.draw_list.begin()
+            state.submit(screen, self.draw_list)
+            if self.cursor_img:
+                self.draw_list.add(CURSOR, self.cursor_img, viewport.mouse_pos())
+            self.draw_list.flush(screen)
+            return
+
+        # Other states draw at logical size, scaled once if the render resolution differs
+        canvas = viewport.logical_canvas()
+        if state is not None:
+            state.render(canvas)
+
+        if self.cursor_img:
+            mx, my = viewport.mouse_pos()
+            canvas.blit(self.cursor_img, (mx, my))
+        viewport.present_logical(canvas)
 
     def _handle_events(self):
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.running = False
+                self.stop_render_thread()
                 pygame.quit()
                 sys.exit()
 
@@ -85,11 +270,36 @@ class GameManager:
             self.states[self.current_state].update(dt)
 
     def _render(self):
-        if self.current_state in self.states:
-            self.states[self.current_state].render(self.screen)
-
-        if self.cursor_img:
-            mx, my = pygame.mouse.get_pos()
-            self.screen.blit(self.cursor_img, (mx, my))
+        state = self.states.get(self.current_state)
+        if self.render_thread and self.render_thread.failed:
+            self.stop_render_thread()   # draw errors: back to the serial loop
+        if self.render_thread and hasattr(state, 'submit'):
+            self.render_thread.present_drawn(viewport.present)    # frame the thread finished
+            self._publish_frame(state)
+        elif self.render_thread:
+            # screens without a draw list draw here, once the thread is done with the screen
+            self.render_thread.wait_idle()
+            self._draw_frame(self.screen)
+            viewport.present()
+        elif self.texture_backend:
+            self._draw_textured(state)
+        # dirty rects need the render surface to be the display (not software scaling)
+        elif self.dirty_renderer and hasattr(state, 'dirty_regions') and not viewport.software:
+            regions = state.dirty_regions()
+            if self.cursor_img:
+                regions['cursor'] = (self.cursor_img.get_rect(topleft=viewport.mouse_pos()), None)
+            self.dirty_renderer.present(self.screen, state, regions, self._draw_frame)
+        else:
+            self._draw_frame(self.screen)
+            viewport.present()
+            if self.dirty_renderer:
+                self.dirty_renderer.invalidate()
+        text_cache.end_frame()
 
-        pygame.display.flip()
\ No newline at end of file
+        if not self.first_flip_done:
+            self.first_flip_done = True
+            self.mark_startup('first flip')
+        if self.current_state == GameState.MENU:
+            self.mark_startup('first menu frame')
+            if self.exit_when_interactive:
+                self.running = False
\ No newline at end of file
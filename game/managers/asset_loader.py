@@ -0,0 +1,145 @@
+"""
+Asset Preloader - decodes the ASSETS / SOUNDS manifest on a thread pool
+Worker threads turn files into plain RGBA buffers; the main thread only wraps
+finished buffers into surfaces (a memcpy), a few per frame, so the window keeps
+responding while the loading screen shows real progress.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+from config.settings import ASSETS, SOUNDS, PRELOAD_WORKERS, USE_TEXTURE_ATLAS
+from game.managers.asset_manager import asset_manager, sprite_targets, image_targets
+from game.managers.audio_manager import ensure_mixer
+
+
+def build_manifest():
+    """
+    List every asset to preload.
+
+    Returns:
+        list: ('image', path, size) and ('sound', path, None) jobs
+    """
+    jobs = [('image', path, size) for path, size in image_targets()]
+    if asset_manager.releases_backgrounds:
+        # low-memory tiers load these on state entry instead of keeping them resident
+        skipped = {ASSETS['bg_main'], ASSETS['bg_game_over']}
+        jobs = [job for job in jobs if job[1] not in skipped]
+    # BGM is streamed by pygame.mixer.music, only sound effects are decoded
+    for key, path in SOUNDS.items():
+        if key.startswith('sfx_'):
+            jobs.append(('sound', path, None))
+    return jobs
+
+
+def _decode_image(path, size):
+    """Worker: load + scale, return a plain RGBA buffer (no Surface crosses threads)."""
+    surface = pygame.image.load(path)
+    if size is not None:
+        surface = pygame.transform.scale(surface, size)
+    return surface.get_size(), pygame.image.tostring(surface, 'RGBA')
+
+
+def _decode_sound(path):
+    """Worker: decode a sound file into a mixer Sound."""
+    return pygame.mixer.Sound(path)
+
+
+class AssetPreloader:
+    """Runs the manifest on worker threads and finalizes results on the main thread."""
+
+    def __init__(self, manifest=None, workers=PRELOAD_WORKERS):
+        """
+        Args:
+            manifest (list): Jobs from build_manifest(), defaults to the full manifest
+            workers (int): Number of decode threads
+        """
+        self.manifest = manifest if manifest is not None else build_manifest()
+        self.workers = workers
+        self._executor = None
+        self._pending = []      # (job, future)
+        self.total = len(self.manifest)
+        self.finished = 0
+        self.failed = []
+        self.start_time = None
+        self.elapsed = None     # seconds from start() to done
+
+    def start(self):
+        """Submit every job to the thread pool."""
+        self.start_time = time.perf_counter()
+        if any(kind == 'sound' for kind, _, _ in self.manifest):
+            ensure_mixer()  # worker threads decode sounds, so open the mixer here
+        self._executor = ThreadPoolExecutor(max_workers=self.workers,
+                                            thread_name_prefix='asset-preload')
+        for job in self.manifest:
+            kind, path, size = job
+            if kind == 'image' and asset_manager.is_baked(path, size):
+                # baked sprites need no decode, finalize maps them directly
+                self._pending.append((job, None))
+                continue
+            if kind == 'image':
+                future = self._executor.submit(_decode_image, path, size)
+            else:
+                future = self._executor.submit(_decode_sound, path)
+            self._pending.append((job, future))
+
+    @property
+    def progress(self):
+        """Fraction of jobs finalized, 0.0 -> 1.0."""
+        return self.finished / self.total if self.total else 1.0
+
+    @property
+    def done(self):
+        return self.finished >= self.total
+
+    def finalize(self, time_budget):
+        """
+        Turn finished worker results into surfaces / cache entries (main thread only).
+
+        Args:
+            time_budget (float): Seconds this call may spend
+
+        Returns:
+            bool: True when every job has been finalized
+        """
+        deadline = time.perf_counter() + time_budget
+        still_pending = []
+        for job, future in self._pending:
+            if (future is not None and not future.done()) or time.perf_counter() > deadline:
+                still_pending.append((job, future))
+                continue
+            self._finalize_job(job, future)
+        self._pending = still_pending
+
+        if self.done and self.elapsed is None:
+            self._on_complete()
+        return self.done
+
+    def _finalize_job(self, job, future):
+        kind, path, size = job
+        self.finished += 1
+        if future is None:
+            asset_manager.image(path, size)
+            return
+        try:
+            result = future.result()
+        except Exception as e:
+            self.failed.append(path)
+            print(f"Failed to preload: {path}, error: {e}")
+            return
+
+        if kind == 'image':
+            (w, h), pixels = result
+            surface = pygame.image.frombuffer(pixels, (w, h), 'RGBA')
+            asset_manager.add_image(path, size, surface)
+        else:
+            asset_manager.add_sound(path, result)
+
+    def _on_complete(self):
+        self._executor.shutdown(wait=False)
+        if USE_TEXTURE_ATLAS:
+            # every sprite is cached by now, so packing is only blits
+            asset_manager.build_atlas(sprite_targets())
+        asset_manager.warm_up_fonts()
+        self.elapsed = time.perf_counter() - self.start_time
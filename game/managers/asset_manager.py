@@ -0,0 +1,423 @@
+"""
+Asset Manager - shared cache for images, fonts and sounds
+Every entity, UI widget and state fetches its resources from here, so an asset
+is decoded (and scaled) once and then reused by every later spawn.
+"""
+
+import os
+import weakref
+from collections import OrderedDict
+
+import pygame
+from config.settings import (ASSETS, FONT_PATH, ITEM_DESCRIPTIONS, ITEM_SIZE, NPC_SIZE,
+                             WINDOW_WIDTH, WINDOW_HEIGHT, CURSOR_SIZE, HUD_ICON_SIZE,
+                             SPRAY_BUTTON_SIZE, ASSET_CACHE_BUDGET, USE_TEXTURE_ATLAS,
+                             USE_SPRITE_CACHE, CONVERT_SURFACES, ASSET_QUALITY, NPC_FULL_SIZE_COPIES)
+from game.managers.texture_atlas import TextureAtlas
+from game.managers.sprite_cache import SpriteCache
+from game.managers.audio_manager import ensure_mixer
+
+
+def sprite_targets():
+    """
+    List the sprites that are spawned during play at their final size.
+
+    Returns:
+        list: (path, size) pairs for every item and NPC sprite
+    """
+    targets = [(ASSETS[f'item_{t}'], data.get('size', ITEM_SIZE))
+               for t, data in ITEM_DESCRIPTIONS.items() if f'item_{t}' in ASSETS]
+    targets += [(path, NPC_SIZE) for path in npc_paths()]
+    return targets
+
+
+def npc_paths():
+    """Image paths of every NPC sprite (customers, thief, police)"""
+    return [path for key, path in ASSETS.items() if key.startswith('npc_') or key in ('thief', 'police')]
+
+
+# Bit depth used for opaque images in each quality tier (None = display depth)
+QUALITY_DEPTHS = {'full': None, 'half': 16, 'palettized': 8}
+
+# Resolution NPC sprites are stored at in each quality tier. They are most of
+# the sprite memory (375x470 RGBA each). Copies scaled back to NPC_SIZE are
+# shared and cached for the NPC types seen last (NPC_FULL_SIZE_COPIES, counted
+# against the budget). Items are small and spawn constantly, they stay full size.
+QUALITY_NPC_SCALES = {'full': 1.0, 'half': 0.5, 'palettized': 0.5}
+
+
+# Size each non-sprite image is drawn at (None = file size)
+ASSET_TARGET_SIZES = {
+    'bg_main': (WINDOW_WIDTH, WINDOW_HEIGHT),
+    'bg_menu': (WINDOW_WIDTH, WINDOW_HEIGHT),
+    'bg_game_over': (WINDOW_WIDTH, WINDOW_HEIGHT),
+    'cursor': CURSOR_SIZE,
+    'icon_clock': HUD_ICON_SIZE,
+    'icon_money': HUD_ICON_SIZE,
+    'item_spray': SPRAY_BUTTON_SIZE,
+}
+
+
+def image_targets():
+    """
+    List every image in ASSETS at the size it is drawn in game.
+
+    Returns:
+        list: (path, size) pairs, sprites first
+    """
+    targets = sprite_targets()
+    sprite_paths = {path for path, _ in targets}
+    for key, path in ASSETS.items():
+        if path not in sprite_paths:
+            targets.append((path, ASSET_TARGET_SIZES.get(key)))
+    return targets
+
+
+class AssetManager:
+    """
+    Keyed asset cache with a byte budget and LRU eviction.
+
+    Keys are (kind, path, size, transform). When the bytes held by the cache go
+    over the budget, the least recently used entries are dropped. Entities that
+    still hold a surface keep it alive; eviction only forgets the shared copy.
+    """
+
+    def __init__(self, budget_bytes=ASSET_CACHE_BUDGET):
+        """
+        Args:
+            budget_bytes (int): Maximum bytes kept in the cache
+        """
+        self.budget_bytes = budget_bytes
+        self._cache = OrderedDict()     # key -> (asset, nbytes)
+        self.bytes_used = 0
+        self.atlas = None               # TextureAtlas, see build_atlas()
+        self._sprite_cache = None       # SpriteCache, opened on first use
+        self.convert_surfaces = CONVERT_SURFACES
+        self.quality = ASSET_QUALITY
+        # full-size NPC copies still held by live NPCs after leaving the cache
+        self._live_full_size = weakref.WeakValueDictionary()
+
+        # Profiling counters
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    # ------------------------------------------------------------------ public
+    def image(self, path, size=None, transform=None):
+        """
+        Get an image surface, loading and scaling it on the first request.
+
+        Args:
+            path (str): Image path (usually a value of ASSETS)
+            size (tuple): Target (width, height), or None to keep the file size
+            transform (tuple): Optional extra step, ('rotate', angle) or ('flip', x, y)
+
+        Returns:
+            pygame.Surface: Shared surface, callers must copy before drawing on it
+        """
+        if transform is None and self.atlas is not None:
+            region = self.atlas.get((path, size))
+            if region is not None:
+                self.hits += 1
+                return self._full_size(region, path, size)
+
+        key = ('image', path, size, transform)
+        cached = self._get(key)
+        if cached is not None:
+            return self._full_size(cached, path, size) if transform is None else cached
+
+        surface = self._load_baked(path, size)
+        if surface is None:
+            surface = pygame.image.load(path)
+            if size is not None:
+                surface = pygame.transform.scale(surface, size)
+        if transform is not None:
+            surface = self.prepare_surface(self._apply_transform(surface, transform))
+            self._put(key, surface, self._surface_bytes(surface))
+            return surface
+        surface = self.prepare_surface(self._reduce(surface, path, size))
+
+        self._put(key, surface, self._surface_bytes(surface))
+        return self._full_size(surface, path, size)
+
+    def font(self, path, size, bold=False):
+        """
+        Get a font object.
+
+        Args:
+            path (str): TTF path, or None for the pygame default font
+            size (int): Point size
+            bold (bool): Apply synthetic bold
+        """
+        key = ('font', path, size, bold)
+        cached = self._get(key)
+        if cached is not None:
+            return cached
+
+        font = pygame.font.Font(path, size)
+        if bold:
+            font.set_bold(True)
+
+        nbytes = os.path.getsize(path) if path and os.path.exists(path) else 0
+        self._put(key, font, nbytes)
+        return font
+
+    def sound(self, path):
+        """Get a pygame.mixer.Sound decoded once and shared."""
+        key = ('sound', path, None, None)
+        cached = self._get(key)
+        if cached is not None:
+            return cached
+
+        ensure_mixer()
+        sound = pygame.mixer.Sound(path)
+        self._put(key, sound, self._sound_bytes(sound))
+        return sound
+
+    def prepare_surface(self, surface, colorkey=None):
+        """
+        Convert a surface to the display pixel format so blits skip per-pixel conversion.
+
+        Opaque images get convert() (at the quality tier's bit depth), images with
+        transparent pixels get convert_alpha(), and colorkey images keep their key
+        with RLE acceleration. Does nothing before pygame.display.set_mode() or
+        when conversion is disabled.
+
+        Args:
+            surface (pygame.Surface): Freshly loaded / generated surface
+            colorkey (tuple): Optional color to treat as transparent
+
+        Returns:
+            pygame.Surface: Converted surface (a new one) or the input surface
+        """
+        if not self.convert_surfaces or not pygame.display.get_surface():
+            return surface
+
+        colorkey = colorkey if colorkey is not None else surface.get_colorkey()
+        if colorkey is not None:
+            converted = surface.convert()
+            converted.set_colorkey(colorkey, pygame.RLEACCEL)
+            return converted
+        if self._has_transparency(surface):
+            return surface.convert_alpha()
+        depth = QUALITY_DEPTHS.get(self.quality)
+        return surface.convert(depth) if depth else surface.convert()
+
+    @property
+    def releases_backgrounds(self):
+        """True if inactive states should drop their backgrounds (low-memory tiers)."""
+        return self.quality != 'full'
+
+    def release(self, path):
+        """Forget every cached image loaded from path (any size / transform)."""
+        for key in [k for k in self._cache if k[0] == 'image' and k[1] == path]:
+            _, nbytes = self._cache.pop(key)
+            self.bytes_used -= nbytes
+
+    def resident_bytes(self):
+        """Bytes of surface pixels held by the cache and the atlas pages."""
+        image_bytes = sum(nbytes for key, (_, nbytes) in self._cache.items() if key[0] == 'image')
+        atlas_bytes = self.atlas.stats()['atlas_bytes'] if self.atlas else 0
+        return image_bytes + atlas_bytes
+
+    def is_baked(self, path, size):
+        """True if image(path, size) can be served from the baked sprite file."""
+        cache = self._get_sprite_cache()
+        return cache is not None and cache.has(path, size)
+
+    def add_image(self, path, size, surface):
+        """Store a surface decoded elsewhere (e.g. by the preloader) under the image() key."""
+        key = ('image', path, size, None)
+        if key not in self._cache:
+            surface = self.prepare_surface(self._reduce(surface, path, size))
+            self._put(key, surface, self._surface_bytes(surface))
+
+    def add_sound(self, path, sound):
+        """Store a sound decoded elsewhere under the sound() key."""
+        key = ('sound', path, None, None)
+        if key not in self._cache:
+            self._put(key, sound, self._sound_bytes(sound))
+
+    def build_atlas(self, targets):
+        """
+        Pack sprites into a TextureAtlas; image() then returns atlas regions for them.
+
+        Args:
+            targets (list): (path, size) pairs, see sprite_targets()
+        """
+        sprites = []
+        for path, size in targets:
+            key = ('image', path, size, None)
+            entry = self._cache.pop(key, None)
+            if entry is not None:
+                # already cached as a separate surface: move it into the atlas
+                self.bytes_used -= entry[1]
+                surface = entry[0]
+            else:
+                try:
+                    surface = self._load_baked(path, size)
+                    if surface is None:
+                        surface = pygame.image.load(path)
+                        if size is not None:
+                            surface = pygame.transform.scale(surface, size)
+                except Exception as e:
+                    print(f"Failed to load atlas sprite: {path}, error: {e}")
+                    continue
+                surface = self._reduce(surface, path, size)
+            sprites.append(((path, size), surface))
+
+        self.atlas = TextureAtlas()
+        self.atlas.build(sprites, prepare=self.prepare_surface)
+
+    def warm_up(self):
+        """
+        Decode everything that is spawned during play (item sprites, NPC sprites,
+        dialog bubble and fonts), so later spawns never touch the disk.
+        """
+        jobs = sprite_targets()
+        if USE_TEXTURE_ATLAS:
+            self.build_atlas(jobs)
+            jobs = []
+        jobs.append((ASSETS['bubble_box'], None))
+
+        for path, size in jobs:
+            try:
+                self.image(path, size)
+            except Exception as e:
+                print(f"Failed to warm up image: {path}, error: {e}")
+
+        self.warm_up_fonts()
+
+    def warm_up_fonts(self):
+        """Open the font sizes used by spawned NPCs, popups and the HUD."""
+        for size in (20, 24, 36):
+            try:
+                self.font(FONT_PATH, size)
+            except Exception as e:
+                print(f"Failed to warm up font: {e}")
+
+    def stats(self):
+        """Return a dict of cache counters for profiling."""
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._cache),
+            'bytes_used': self.bytes_used,
+            'budget_bytes': self.budget_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'quality': self.quality,
+            'resident_surface_bytes': self.resident_bytes(),
+            'atlas': self.atlas.stats() if self.atlas else None,
+        }
+
+    def clear(self):
+        """Drop every cached asset and the atlas (counters are kept)."""
+        self._cache.clear()
+        self._live_full_size.clear()
+        self.bytes_used = 0
+        self.atlas = None
+
+    # ----------------------------------------------------------------- private
+    def _get_sprite_cache(self):
+        if USE_SPRITE_CACHE and self._sprite_cache is None:
+            self._sprite_cache = SpriteCache()
+        return self._sprite_cache
+
+    def _load_baked(self, path, size):
+        cache = self._get_sprite_cache()
+        return cache.get(path, size) if cache is not None else None
+
+    def _get(self, key):
+        entry = self._cache.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._cache.move_to_end(key)
+        return entry[0]
+
+    def _put(self, key, asset, nbytes):
+        self._cache[key] = (asset, nbytes)
+        self.bytes_used += nbytes
+        # Evict least recently used entries, but never the one just added
+        while self.bytes_used > self.budget_bytes and len(self._cache) > 1:
+            _, (_, old_bytes) = self._cache.popitem(last=False)
+            self.bytes_used -= old_bytes
+            self.evictions += 1
+
+    def _reduced(self, path, size):
+        """True if the quality tier stores this image below its drawn size"""
+        return size is not None and QUALITY_NPC_SCALES.get(self.quality, 1.0) != 1.0 and path in npc_paths()
+
+    def _reduce(self, surface, path, size):
+        """Shrink an NPC sprite to the quality tier's stored resolution"""
+        if not self._reduced(path, size):
+            return surface
+        scale = QUALITY_NPC_SCALES[self.quality]
+        return self._resize(surface, (max(1, round(size[0] * scale)), max(1, round(size[1] * scale))))
+
+    def _full_size(self, surface, path, size):
+        """Stored surface, or its cached copy scaled back to size if the tier stored it reduced"""
+        if not self._reduced(path, size):
+            return surface
+        key = ('image', path, size, 'full_size')
+        entry = self._cache.get(key)
+        if entry is not None:
+            self._cache.move_to_end(key)
+            return entry[0]
+
+        # 1. Scale up once per type, unless an NPC on screen still holds the copy
+        full = self._live_full_size.get(key)
+        if full is None:
+            full = self._resize(surface, size)
+            self._live_full_size[key] = full
+        self._put(key, full, self._surface_bytes(full))
+
+        # 2. Keep only the types seen last
+        copies = [k for k in self._cache if k[3] == 'full_size']
+        for old in copies[:max(0, len(copies) - NPC_FULL_SIZE_COPIES)]:
+            _, nbytes = self._cache.pop(old)
+            self.bytes_used -= nbytes
+            self.evictions += 1
+        return full
+
+    @staticmethod
+    def _resize(surface, size):
+        # smoothscale only takes 24/32 bit pixels
+        if surface.get_bitsize() >= 24:
+            return pygame.transform.smoothscale(surface, size)
+        return pygame.transform.scale(surface, size)
+
+    def _apply_transform(self, surface, transform):
+        name = transform[0]
+        if name == 'rotate':
+            return pygame.transform.rotate(surface, transform[1])
+        if name == 'flip':
+            return pygame.transform.flip(surface, transform[1], transform[2])
+        raise ValueError(f"Unknown image transform: {transform}")
+
+    @staticmethod
+    def _has_transparency(surface):
+        if not surface.get_flags() & pygame.SRCALPHA:
+            return False
+        # bits are set where alpha > 254, any unset bit is a (partly) transparent pixel
+        width, height = surface.get_size()
+        return pygame.mask.from_surface(surface, 254).count() < width * height
+
+    @staticmethod
+    def _surface_bytes(surface):
+        return int(surface.get_bytesize() * surface.get_width() * surface.get_height())
+
+    @staticmethod
+    def _sound_bytes(sound):
+        mixer_init = pygame.mixer.get_init()
+        if not isinstance(mixer_init, tuple):
+            return 0
+        frequency, fmt, channels = mixer_init
+        return int(sound.get_length() * frequency * channels * (abs(fmt) // 8))
+
+
+# Shared instance used across the game
+asset_manager = AssetManager()
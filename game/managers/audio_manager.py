@@ -0,0 +1,185 @@
+"""
+Audio Manager - shared sound bank, fixed channel pool and background music switching
+The mixer is only opened when a sound is first needed. Every SFX in SOUNDS is
+decoded once into the bank and plays on its own reserved channels, so one
+sound spamming (e.g. the spray) never cuts off the others. Music is loaded on a
+worker thread so a state change never waits for the music file.
+"""
+
+import queue
+import threading
+import time
+
+import pygame
+from config.settings import SOUNDS, SFX_SETTINGS, FREE_SFX_CHANNELS
+
+
+def ensure_mixer():
+    """
+    Initialize pygame.mixer on first use.
+
+    Returns:
+        bool: True if the mixer is ready
+    """
+    if pygame.mixer.get_init():
+        return True
+    try:
+        pygame.mixer.init()
+    except pygame.error as e:
+        print(f"Failed to init the mixer: {e}")
+        return False
+    return True
+
+
+class SoundHandle:
+    """What states hold instead of a pygame Sound: play() goes through the channel pool."""
+
+    def __init__(self, audio, name):
+        """
+        Args:
+            audio (AudioManager): Owner of the bank and the channels
+            name (str): SOUNDS key, e.g. 'sfx_money'
+        """
+        self.audio = audio
+        self.name = name
+
+    def play(self):
+        """Play on one of this sound's channels"""
+        self.audio.play(self.name)
+
+    def set_volume(self, volume):
+        """Change the bank volume of this sound (shared by every handle)"""
+        self.audio.set_volume(self.name, volume)
+
+
+class AudioManager:
+    """
+    Sound bank + channel pool + music worker.
+
+    Each SFX gets as many reserved channels as its concurrency limit in
+    SFX_SETTINGS. When all of them are busy the oldest one is restarted.
+    """
+
+    def __init__(self):
+        self.bank = {}          # name -> pygame.mixer.Sound
+        self.volumes = {name: volume for name, (volume, _) in SFX_SETTINGS.items()}
+        self.channels = {}      # name -> list of pygame.mixer.Channel
+        self.started = {}       # channel id -> start time (for restarting the oldest)
+        self.steals = 0         # plays that had to restart a busy channel
+
+        # music worker
+        self.current_music = None
+        self._music_queue = queue.Queue()
+        self._music_thread = None
+
+    # -------- sound effects --------
+
+    def sound(self, name):
+        """
+        Return a handle for an SFX, decoding the bank on first use.
+
+        Args:
+            name (str): SOUNDS key
+        """
+        self.load_bank()
+        return SoundHandle(self, name)
+
+    def load_bank(self):
+        """Decode every SFX once and reserve the channel pool"""
+        if self.bank or not ensure_mixer():
+            return
+        from game.managers.asset_manager import asset_manager
+
+        # 1. Decode (hits the asset cache if the preloader already did it)
+        for name in SFX_SETTINGS:
+            try:
+                sound = asset_manager.sound(SOUNDS[name])
+                sound.set_volume(self.volumes[name])
+                self.bank[name] = sound
+            except Exception as e:
+                print(f"Failed to load the sfx: {name}, error: {e}")
+
+        # 2. Reserve channels: sound i owns a fixed slice of the pool
+        total = sum(limit for _, limit in SFX_SETTINGS.values())
+        pygame.mixer.set_num_channels(total + FREE_SFX_CHANNELS)
+        pygame.mixer.set_reserved(total)    # Sound.play() elsewhere never takes them
+        index = 0
+        for name, (_, limit) in SFX_SETTINGS.items():
+            self.channels[name] = [pygame.mixer.Channel(index + i) for i in range(limit)]
+            index += limit
+
+    def play(self, name):
+        """
+        Play an SFX on a free channel of its own, or restart its oldest one.
+
+        Args:
+            name (str): SOUNDS key
+        """
+        sound = self.bank.get(name)
+        if sound is None:
+            return
+        channels = self.channels[name]
+        channel = next((c for c in channels if not c.get_busy()), None)
+        if channel is None:
+            channel = min(channels, key=lambda c: self.started.get(id(c), 0.0))
+            self.steals += 1
+        channel.play(sound)
+        self.started[id(channel)] = time.perf_counter()
+
+    def set_volume(self, name, volume):
+        """
+        Args:
+            name (str): SOUNDS key
+            volume (float): 0.0 -> 1.0
+        """
+        self.volumes[name] = volume
+        if name in self.bank:
+            self.bank[name].set_volume(volume)
+
+    # -------- music --------
+
+    def play_music(self, path, volume=None, loops=-1):
+        """
+        Queue a BGM switch; the load happens on the music thread.
+        Asking for the track that is already playing only changes the volume.
+
+        Args:
+            path (str): Music file path
+            volume (float): Optional volume 0.0 -> 1.0
+            loops (int): -1 repeats forever
+        """
+        if not ensure_mixer():
+            return
+        if self._music_thread is None:
+            self._music_thread = threading.Thread(target=self._music_worker, daemon=True)
+            self._music_thread.start()
+        self._music_queue.put((path, volume, loops))
+
+    def _music_worker(self):
+        """Run music requests in order, skipping ones already replaced by a newer request"""
+        while True:
+            request = self._music_queue.get()
+            while not self._music_queue.empty():
+                request = self._music_queue.get()
+            path, volume, loops = request
+            try:
+                if path != self.current_music or not pygame.mixer.music.get_busy():
+                    pygame.mixer.music.load(path)
+                    pygame.mixer.music.play(loops)
+                    self.current_music = path
+                if volume is not None:
+                    pygame.mixer.music.set_volume(volume)
+            except Exception as e:
+                print(f"Failed to play BGM: {path}, error: {e}")
+
+    def stats(self):
+        """Bank and channel numbers"""
+        return {
+            'sounds': len(self.bank),
+            'channels': sum(len(c) for c in self.channels.values()),
+            'steals': self.steals,
+            'music': self.current_music,
+        }
+
+
+audio_manager = AudioManager()
@@ -7,6 +7,9 @@ class InventoryManager:
     def __init__(self):
         # a list that record the desk item
         self.desk_items = []
+        # bumped on add/remove, and whether anything moved last update (hover checks use both)
+        self.version = 0
+        self.items_moving = False
 
     '''
     where is the storage?
@@ -15,10 +18,12 @@ class InventoryManager:
         # move out from the storage
         item.in_storage = False
         self.desk_items.append(item)
+        self.version += 1
 
     def remove_item(self, item):
         if item in self.desk_items:
             self.desk_items.remove(item)
+            self.version += 1
 
     '''
     why need reverse there is not front and back
@@ -51,8 +56,10 @@ class InventoryManager:
 
     def update(self, dt):
         # update the item position, this function embedded in item class
+        moving = False
         for item in self.desk_items:
             item.update_physics(dt)
+            if item.vx or item.vy or item.va: moving = True
 
             # limitation for the desk canvas
             desk_rect = pygame.Rect(DESK_AREA['x'], DESK_AREA['y'], DESK_AREA['width'], DESK_AREA['height'])
@@ -68,6 +75,8 @@ class InventoryManager:
                 # update the position after reach the desk's side
                 item.set_position(item.x, item.y)
 
+        self.items_moving = moving
+
         # collision
         push_strength = 0.3
         for i, item_a in enumerate(self.desk_items):
@@ -0,0 +1,191 @@
+"""
+Sprite Cache - offline baked, memory-mapped sprites
+bake_sprite_cache() pre-scales every image in ASSETS to its in-game size and
+writes raw RGBA blobs into one indexed file. At runtime SpriteCache maps the
+file and wraps blobs with pygame.image.frombuffer, so there is no decode and
+no scale step.
+
+File layout:
+    MAGIC (8 bytes) | index length (4 bytes, little endian) | JSON index | blobs
+Blob offsets in the index are relative to the first 16-byte aligned position
+after the index.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+
+import pygame
+from config.settings import SPRITE_CACHE_PATH
+
+MAGIC = b'LBFSPR01'
+HEADER = struct.Struct('<8sI')
+BLOB_ALIGN = 16
+
+
+def _entry_key(path, size):
+    """Index key for an image path at a target size"""
+    return f"{path}|{size[0]}x{size[1]}" if size else f"{path}|native"
+
+
+def _content_hash(path, size):
+    """Hash of the source file plus the target size; changes when either changes"""
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        digest.update(f.read())
+    digest.update(repr(size).encode())
+    return digest.hexdigest()
+
+
+def _blob_start(index_len):
+    """File offset of the first blob for an index of index_len bytes"""
+    start = HEADER.size + index_len
+    return start + (-start % BLOB_ALIGN)
+
+
+def _read_cache(path):
+    """Return (index dict, blob bytes) of an existing cache, or ({}, b'')"""
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+        magic, index_len = HEADER.unpack_from(data, 0)
+        if magic != MAGIC:
+            return {}, b''
+        index = json.loads(data[HEADER.size:HEADER.size + index_len].decode('utf-8'))
+        return index, data[_blob_start(index_len):]
+    except (OSError, ValueError, struct.error):
+        return {}, b''
+
+
+def bake_sprite_cache(targets, cache_path=SPRITE_CACHE_PATH, force=False):
+    """
+    Write the baked sprite file, rebuilding only entries whose source changed.
+
+    Args:
+        targets (list): (path, size) pairs, see asset_manager.image_targets()
+        cache_path (str): Output file
+        force (bool): Rebuild every entry
+
+    Returns:
+        dict: Counts of 'rebuilt', 'reused' and 'failed' entries
+    """
+    old_index, old_blobs = ({}, b'') if force else _read_cache(cache_path)
+    counts = {'rebuilt': 0, 'reused': 0, 'failed': 0}
+
+    # 1. Collect pixel blobs (copied from the old file when the hash matches)
+    entries = []    # (key, meta, pixels)
+    for path, size in targets:
+        key = _entry_key(path, size)
+        try:
+            content_hash = _content_hash(path, size)
+        except OSError as e:
+            print(f"Failed to bake: {path}, error: {e}")
+            counts['failed'] += 1
+            continue
+
+        old = old_index.get(key)
+        if old and old['hash'] == content_hash:
+            pixels = old_blobs[old['offset']:old['offset'] + old['length']]
+            width, height = old['width'], old['height']
+            counts['reused'] += 1
+        else:
+            try:
+                surface = pygame.image.load(path)
+            except pygame.error as e:
+                print(f"Failed to bake: {path}, error: {e}")
+                counts['failed'] += 1
+                continue
+            if size is not None:
+                surface = pygame.transform.scale(surface, size)
+            pixels = pygame.image.tostring(surface, 'RGBA')
+            width, height = surface.get_size()
+            counts['rebuilt'] += 1
+
+        stat = os.stat(path)
+        meta = {'hash': content_hash, 'width': width, 'height': height,
+                'mtime': stat.st_mtime, 'source_size': stat.st_size}
+        entries.append((key, meta, pixels))
+
+    # 2. Lay out blobs (16-byte aligned, offsets relative to the blob area)
+    index = {}
+    offset = 0
+    for key, meta, pixels in entries:
+        index[key] = dict(meta, offset=offset, length=len(pixels))
+        offset += len(pixels) + (-len(pixels) % BLOB_ALIGN)
+    index_bytes = json.dumps(index).encode('utf-8')
+
+    # 3. Write to a temp file and swap it in
+    os.makedirs(os.path.dirname(cache_path) or '.', exist_ok=True)
+    tmp_path = cache_path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, len(index_bytes)))
+        f.write(index_bytes)
+        f.write(b'\0' * (_blob_start(len(index_bytes)) - f.tell()))
+        for key, meta, pixels in entries:
+            f.write(pixels)
+            f.write(b'\0' * (-len(pixels) % BLOB_ALIGN))
+    os.replace(tmp_path, cache_path)
+    return counts
+
+
+class SpriteCache:
+    """Read side of the baked file: memory-maps it and hands out surfaces."""
+
+    def __init__(self, cache_path=SPRITE_CACHE_PATH):
+        """
+        Args:
+            cache_path (str): Baked file written by bake_sprite_cache()
+        """
+        self.cache_path = cache_path
+        self.index = {}
+        self._file = None
+        self._map = None
+        self._blob_start = 0
+        self.hits = 0
+
+        try:
+            self._file = open(cache_path, 'rb')
+            # copy-on-write mapping: pages come from the OS cache, writes stay private
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_COPY)
+            magic, index_len = HEADER.unpack_from(self._map, 0)
+            if magic != MAGIC:
+                raise ValueError("bad sprite cache header")
+            self.index = json.loads(self._map[HEADER.size:HEADER.size + index_len].decode('utf-8'))
+            self._blob_start = _blob_start(index_len)
+        except (OSError, ValueError, struct.error) as e:
+            if not isinstance(e, FileNotFoundError):
+                print(f"Failed to open sprite cache: {e}")
+            self.close()
+
+    def has(self, path, size):
+        """True if a fresh baked entry exists (source file unchanged since the bake)"""
+        meta = self.index.get(_entry_key(path, size))
+        if meta is None:
+            return False
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return True     # source removed, the baked copy is still valid
+        return stat.st_mtime == meta['mtime'] and stat.st_size == meta['source_size']
+
+    def get(self, path, size):
+        """
+        Return a surface backed by the mapped file, or None if not baked / stale.
+        """
+        if self._map is None or not self.has(path, size):
+            return None
+        meta = self.index[_entry_key(path, size)]
+        start = self._blob_start + meta['offset']
+        pixels = memoryview(self._map)[start:start + meta['length']]
+        self.hits += 1
+        return pygame.image.frombuffer(pixels, (meta['width'], meta['height']), 'RGBA')
+
+    def close(self):
+        """Drop the mapping (surfaces already handed out keep their buffer alive)"""
+        self.index = {}
+        self._map = None
+        if self._file:
+            self._file.close()
+            self._file = None
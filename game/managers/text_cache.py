@@ -0,0 +1,93 @@
+"""
+Text Cache - rendered text surfaces shared by every UI element
+Font.render() is one of the most expensive calls in a frame, and most strings
+(HUD values, button labels, dialog lines) stay the same for many frames.
+Surfaces are keyed by (font path, size, bold, text, color, antialias) and the
+least recently used ones are dropped once the cache is full.
+"""
+
+from collections import OrderedDict
+
+from config.settings import TEXT_CACHE_SIZE
+from game.managers.asset_manager import asset_manager
+
+
+class TextCache:
+    """LRU cache of rendered text with per-frame hit counters."""
+
+    def __init__(self, max_entries=TEXT_CACHE_SIZE):
+        """
+        Args:
+            max_entries (int): Surfaces kept before the oldest is dropped
+        """
+        self.max_entries = max_entries
+        self.cache = OrderedDict()   # key -> pygame.Surface
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # counters of the frame in progress and of the last finished frame
+        self.frame_hits = 0
+        self.frame_misses = 0
+        self.last_frame = (0, 0)
+
+    def render(self, font_path, size, text, color, antialias=True, bold=False):
+        """
+        Get the surface for a string, rendering it only on a miss.
+
+        Args:
+            font_path (str): TTF path, or None for the pygame default font
+            size (int): Point size
+            text (str): String to draw
+            color (tuple): RGB text color
+            antialias (bool): Smooth edges
+            bold (bool): Synthetic bold
+
+        Returns:
+            pygame.Surface: Shared surface, callers must copy before changing it
+        """
+        key = (font_path, size, bold, text, tuple(color), antialias)
+        surface = self.cache.get(key)
+        if surface is not None:
+            self.cache.move_to_end(key)
+            self.hits += 1
+            self.frame_hits += 1
+            return surface
+
+        self.misses += 1
+        self.frame_misses += 1
+        font = asset_manager.font(font_path, size, bold=bold)
+        surface = font.render(text, antialias, color)
+        self.cache[key] = surface
+        if len(self.cache) > self.max_entries:
+            self.cache.popitem(last=False)
+            self.evictions += 1
+        return surface
+
+    def end_frame(self):
+        """Close the per-frame counters (called once per frame by the game loop)"""
+        self.last_frame = (self.frame_hits, self.frame_misses)
+        self.frame_hits = 0
+        self.frame_misses = 0
+
+    def clear(self):
+        """Drop every cached surface"""
+        self.cache.clear()
+
+    def stats(self):
+        """Total and last-frame hit rates"""
+        total = self.hits + self.misses
+        frame_hits, frame_misses = self.last_frame
+        frame_total = frame_hits + frame_misses
+        return {
+            'entries': len(self.cache),
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / total if total else 0.0,
+            'frame_hits': frame_hits,
+            'frame_misses': frame_misses,
+            'frame_hit_rate': frame_hits / frame_total if frame_total else 0.0,
+        }
+
+
+text_cache = TextCache()
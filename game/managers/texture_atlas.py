@@ -0,0 +1,101 @@
+"""
+Texture Atlas - packs many small sprites into a few large surfaces
+Entities get subsurface regions of an atlas page instead of owning their own pixels.
+"""
+
+import pygame
+from config.settings import ATLAS_PAGE_SIZE
+
+
+class TextureAtlas:
+    """
+    Shelf packer for sprites that are already at their final on-screen size.
+
+    Sprites are sorted by height and placed left to right on shelves; a new
+    shelf starts when a row is full and a new page starts when a page is full.
+    Each page is trimmed to the height it actually uses.
+    """
+
+    def __init__(self, page_size=ATLAS_PAGE_SIZE, padding=1):
+        """
+        Args:
+            page_size (int): Width and maximum height of one atlas page
+            padding (int): Empty pixels between sprites (avoids bleeding when scaled)
+        """
+        self.page_size = page_size
+        self.padding = padding
+        self.pages = []         # list of pygame.Surface
+        self.regions = {}       # key -> subsurface of a page
+        self.sprite_pixels = 0  # pixels covered by sprites (for efficiency stats)
+
+    def build(self, sprites, prepare=None):
+        """
+        Pack sprites into pages.
+
+        Args:
+            sprites (list): (key, surface) pairs, keys must be unique
+            prepare (callable): Optional page -> page step (e.g. pixel format
+                conversion), applied before regions are cut
+        """
+        self.pages = []
+        self.regions = {}
+        self.sprite_pixels = 0
+
+        # 1. Place sprites on shelves (tallest first keeps shelves tight)
+        ordered = sorted(sprites, key=lambda s: s[1].get_height(), reverse=True)
+        placements = []     # (page index, x, y, key, surface)
+        page_heights = []   # used height of every page
+        page, x, y, shelf_h = 0, 0, 0, 0
+        page_heights.append(0)
+
+        for key, surface in ordered:
+            w, h = surface.get_width(), surface.get_height()
+            if w > self.page_size or h > self.page_size:
+                print(f"Sprite too large for atlas: {key} ({w}x{h})")
+                continue
+            # -1.1. Row is full: start a new shelf under the current one
+            if x + w > self.page_size:
+                x, y = 0, y + shelf_h + self.padding
+                shelf_h = 0
+            # -1.2. Page is full: start a new page
+            if y + h > self.page_size:
+                page, x, y, shelf_h = page + 1, 0, 0, 0
+                page_heights.append(0)
+
+            placements.append((page, x, y, key, surface))
+            shelf_h = max(shelf_h, h)
+            page_heights[page] = max(page_heights[page], y + h)
+            x += w + self.padding
+            self.sprite_pixels += w * h
+
+        # 2. Blit sprites into trimmed pages and keep subsurface regions
+        self.pages = [pygame.Surface((self.page_size, height), pygame.SRCALPHA)
+                      for height in page_heights]
+        for page_surf in self.pages:
+            page_surf.fill((0, 0, 0, 0))
+
+        for page, x, y, key, surface in placements:
+            # copy pixels as they are (keep the sprite's alpha, no blending)
+            self.pages[page].blit(surface, (x, y), special_flags=pygame.BLEND_RGBA_MAX)
+        if prepare is not None:
+            self.pages = [prepare(page_surf) for page_surf in self.pages]
+
+        for page, x, y, key, surface in placements:
+            page_surf = self.pages[page]
+            self.regions[key] = page_surf.subsurface(
+                pygame.Rect(x, y, surface.get_width(), surface.get_height()))
+
+    def get(self, key):
+        """Return the region for key, or None if it was not packed."""
+        return self.regions.get(key)
+
+    def stats(self):
+        """Return packing efficiency and memory numbers."""
+        page_pixels = sum(p.get_width() * p.get_height() for p in self.pages)
+        return {
+            'pages': len(self.pages),
+            'sprites': len(self.regions),
+            'atlas_bytes': page_pixels * 4,
+            'sprite_bytes': self.sprite_pixels * 4,
+            'efficiency': self.sprite_pixels / page_pixels if page_pixels else 0.0,
+        }
@@ -0,0 +1 @@
+"""Python 包初始化文件"""
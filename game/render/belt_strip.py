@@ -0,0 +1,59 @@
+"""
+Belt Strip - scrolling conveyor drawn with a single blit
+The belt texture is tiled once into a strip one texture-height taller than
+the screen. Scrolling only moves the source area of the blit. Several lanes
+share one strip (side by side), so extra belts do not add blits per frame.
+"""
+
+import pygame
+from game.managers.asset_manager import asset_manager
+
+
+class BeltStrip:
+    """Pre-tiled belt lanes that scroll together."""
+
+    def __init__(self, texture, lane_centers, screen_height):
+        """
+        Args:
+            texture (pygame.Surface): Belt texture, tiled vertically
+            lane_centers (list): Screen x of the center of every lane
+            screen_height (int): Visible height of the belt
+        """
+        self.tex_w, self.tex_h = texture.get_size()
+        self.screen_height = screen_height
+        lefts = [int(x) - self.tex_w // 2 for x in lane_centers]
+        self.x = min(lefts)
+        width = max(lefts) + self.tex_w - self.x
+
+        # 1. Tile every lane once (gaps between lanes stay transparent)
+        alpha = len(lefts) > 1 or bool(texture.get_flags() & pygame.SRCALPHA)
+        strip = pygame.Surface((width, screen_height + self.tex_h), pygame.SRCALPHA if alpha else 0)
+        if alpha:
+            strip.fill((0, 0, 0, 0))
+        for left in lefts:
+            for y in range(0, screen_height + self.tex_h, self.tex_h):
+                strip.blit(texture, (left - self.x, y))
+        self.strip = asset_manager.prepare_surface(strip)
+
+    def get_rect(self):
+        """Screen rect covered by the belt"""
+        return pygame.Rect(self.x, 0, self.strip.get_width(), self.screen_height)
+
+    def source_top(self, scroll_offset):
+        """Strip row shown at the top of the screen for a scroll offset"""
+        return (self.tex_h - int(scroll_offset) % self.tex_h) % self.tex_h
+
+    def submit(self, draw_list, layer, scroll_offset):
+        """
+        Queue the visible part of the strip on a frame draw list.
+
+        Args:
+            draw_list (DrawList): Frame draw list
+            layer (int): Draw list layer
+            scroll_offset (float): Belt movement in pixels (grows downwards)
+        """
+        draw_list.add(layer, self.strip, (self.x, 0), self._area(scroll_offset))
+
+    def _area(self, scroll_offset):
+        """Part of the strip on screen for a scroll offset"""
+        return pygame.Rect(0, self.source_top(scroll_offset), self.strip.get_width(), self.screen_height)
@@ -0,0 +1,52 @@
+"""
+Culling - skip draws that cannot reach the screen
+Conveyor batches spawn up to a few hundred pixels above the window and
+customers walk in from above it. Before drawing, every entity rect is tested
+against the screen clip rect (the whole window, or the dirty box while the
+dirty rect renderer redraws), and entities outside it are not drawn at all.
+"""
+
+import pygame
+from game.render.draw_list import scale_rect
+
+
+class Culler:
+    """Visibility test against the clip rect of the frame being drawn, with per-frame counters."""
+
+    def __init__(self):
+        self.view = pygame.Rect(0, 0, 0, 0)
+        self.culled = 0
+        self.drawn = 0
+        self.last_frame = (0, 0)    # (drawn, culled) of the last finished frame
+
+    def begin(self, screen, scale=1.0):
+        """
+        Start a frame: take the current clip rect as the visible area.
+
+        Args:
+            screen (pygame.Surface): Target of the frame
+            scale (float): Render pixels per logical pixel (entity rects are logical)
+        """
+        self.last_frame = (self.drawn, self.culled)
+        self.view = pygame.Rect(scale_rect(screen.get_clip(), 1 / scale))
+        self.culled = 0
+        self.drawn = 0
+
+    def visible(self, rect):
+        """
+        Args:
+            rect (pygame.Rect): Screen area an entity draws into (shadow included)
+
+        Returns:
+            bool: True if any of it is inside the visible area
+        """
+        if self.view.colliderect(rect):
+            self.drawn += 1
+            return True
+        self.culled += 1
+        return False
+
+    def stats(self):
+        """Draws kept / skipped in the last finished frame"""
+        drawn, culled = self.last_frame
+        return {'drawn': drawn, 'culled': culled}
@@ -0,0 +1,138 @@
+"""
+Dirty Rect Renderer - redraw and present only the parts of the screen that changed
+States report a region for everything that can change ({key: (rect, look)}).
+A region is dirty when it appeared, disappeared, moved or its look changed.
+The frame is redrawn once with the screen clipped to the box around the dirty
+rects (the state's background restores what was under old positions) and only
+the dirty rects are presented with pygame.display.update(). Large changes fall
+back to a full flip.
+"""
+
+import pygame
+from config.settings import DIRTY_RECT_MAX_AREA, DIRTY_RECT_MAX_RECTS
+from game.render.draw_list import scale_rect
+
+
+def merge_rects(rects, max_rects):
+    """
+    Union overlapping rects, then merge the cheapest pairs until at most max_rects are left.
+
+    Args:
+        rects (list): pygame.Rect list
+        max_rects (int): Upper bound on returned rects
+    """
+    merged = []
+    for rect in rects:
+        rect = pygame.Rect(rect)
+        # -1. Absorb every merged rect that touches this one
+        i = 0
+        while i < len(merged):
+            if rect.colliderect(merged[i]):
+                rect.union_ip(merged.pop(i))
+                i = 0
+            else:
+                i += 1
+        merged.append(rect)
+
+    # -2. Too many passes: join the pair whose union wastes the least area
+    while len(merged) > max_rects:
+        best = None
+        for i in range(len(merged)):
+            for j in range(i + 1, len(merged)):
+                union = merged[i].union(merged[j])
+                waste = union.w * union.h - merged[i].w * merged[i].h - merged[j].w * merged[j].h
+                if best is None or waste < best[0]:
+                    best = (waste, i, j, union)
+        _, i, j, union = best
+        merged.pop(j)
+        merged[i] = union
+    return merged
+
+
+class DirtyRectRenderer:
+    """Tracks last frame's regions and presents only what changed."""
+
+    def __init__(self, max_area=DIRTY_RECT_MAX_AREA, max_rects=DIRTY_RECT_MAX_RECTS):
+        """
+        Args:
+            max_area (float): Dirty share of the screen above which a full flip is used
+            max_rects (int): Rects handed to display.update() before they are merged further
+        """
+        self.max_area = max_area
+        self.max_rects = max_rects
+        self.scale = 1.0        # render pixels per logical pixel (regions are logical)
+        self.owner = None       # state the previous regions belong to
+        self.previous = {}      # key -> (rect, look) of the last presented frame
+
+        # stats
+        self.frames = 0
+        self.full_frames = 0
+        self.rects_presented = 0
+        self.area_presented = 0.0   # sum of dirty screen shares
+
+    def invalidate(self):
+        """Force a full redraw on the next frame (state change, resize, ...)"""
+        self.owner = None
+        self.previous = {}
+
+    def present(self, screen, owner, regions, draw):
+        """
+        Draw and present one frame.
+
+        Args:
+            screen (pygame.Surface): Display surface
+            owner: Object the regions belong to; a new owner forces a full frame
+            regions (dict): key -> (pygame.Rect, look), look is any comparable value
+                that changes when the region's pixels change
+            draw (callable): draw(screen) renders the complete frame
+        """
+        self.frames += 1
+        screen_rect = screen.get_rect()
+        full = owner is not self.owner
+
+        # 1. Collect rects that changed since the last frame
+        dirty = []
+        if not full:
+            for key, (rect, look) in regions.items():
+                old = self.previous.get(key)
+                if old is None:
+                    dirty.append(rect)
+                elif old[0] != rect or old[1] != look:
+                    dirty.append(old[0])
+                    dirty.append(rect)
+            dirty.extend(old[0] for key, old in self.previous.items() if key not in regions)
+            dirty = [pygame.Rect(scale_rect(r, self.scale)).clip(screen_rect) for r in dirty]
+            dirty = merge_rects([r for r in dirty if r.w and r.h], self.max_rects)
+
+        self.owner = owner
+        self.previous = {key: (pygame.Rect(rect), look) for key, (rect, look) in regions.items()}
+
+        # 2. Big change: plain full redraw + flip
+        screen_area = screen_rect.w * screen_rect.h
+        area = sum(r.w * r.h for r in dirty) / screen_area
+        if full or area > self.max_area:
+            draw(screen)
+            pygame.display.flip()
+            self.full_frames += 1
+            self.area_presented += 1.0
+            return
+
+        # 3. One redraw clipped to the box around all dirty rects (a pass per
+        #    rect would repeat the state's python work), present just the rects
+        if not dirty:
+            return
+        screen.set_clip(dirty[0].unionall(dirty[1:]))
+        draw(screen)
+        screen.set_clip(None)
+        pygame.display.update(dirty)
+        self.rects_presented += len(dirty)
+        self.area_presented += area
+
+    def stats(self):
+        """Share of full frames and of the screen presented per frame"""
+        return {
+            'frames': self.frames,
+            'full_frames': self.full_frames,
+            'rects': self.rects_presented,
+            'avg_presented': self.area_presented / self.frames if self.frames else 0.0,
+        }
@@ -0,0 +1,252 @@
+"""
+Draw List - one frame of sprites, sorted by layer and submitted in batches
+Entities add (surface, dest, area) entries to a layer instead of blitting
+themselves. At the end of the frame the list is sorted once by layer (stable,
+so entries of a layer keep their submit order) and runs of plain blits go
+to the screen in a single Surface.blits() call (fblits() where pygame has it).
+The few things that are not blits (selection outline, patience bar) are added
+as rect draws; they split the batch but keep their place in the order. Blits
+with their own alpha (fading popups) are drawn one by one from a private copy,
+so shared surfaces are never changed.
+Backends that can rotate and scale on their own (texture_backend.py) also take
+sprite entries, so rotated / zoomed items need no extra surfaces.
+Entries are always in logical coordinates. When frames are rendered at a
+lower resolution (see viewport.py) the flush scales positions and uses
+pre-scaled copies of the surfaces, kept in a LRU cache.
+"""
+
+import math
+from collections import OrderedDict
+from operator import itemgetter
+
+import pygame
+from config.settings import SCALE_CACHE_SIZE
+
+# Layers, bottom to top
+BACKGROUND = 0
+BELT = 1
+SHADOWS = 2
+ITEMS = 3
+NPCS = 4
+UI = 5
+DRAG = 6
+TOOLTIP = 7
+CURSOR = 8
+
+LAYER_NAMES = ('background', 'belt', 'shadows', 'items', 'npcs', 'ui', 'drag', 'tooltip', 'cursor')
+
+# Entry kinds
+BLIT = 0        # (surface, dest, area, version, alpha)
+RECT = 1        # (color, rect, width, border_radius)
+SPRITE = 2      # (source, center, angle, scale, shadow)
+
+
+def scale_rect(rect, scale):
+    """Logical rect -> smallest render rect covering it"""
+    if scale == 1.0:
+        return rect
+    x, y, w, h = rect
+    left, top = math.floor(x * scale), math.floor(y * scale)
+    return pygame.Rect(left, top, max(1, math.ceil((x + w) * scale) - left), max(1, math.ceil((y + h) * scale) - top))
+
+
+class DrawList:
+    """Per-frame list of blits and draw calls with counters."""
+
+    def __init__(self, scale=1.0, cache_size=SCALE_CACHE_SIZE):
+        """
+        Args:
+            scale (float): Render pixels per logical pixel
+            cache_size (int): Scaled surfaces kept before the oldest is dropped
+        """
+        self.entries = []   # (layer, kind, data), see the entry kinds above
+        self.scale = scale
+        self.transforms = False     # set by backends that draw SPRITE entries
+        self.cache_size = cache_size
+        self._scaled = OrderedDict()    # (id, version) -> (source, scaled / faded copy)
+        self._frozen = {}               # id -> (version, source, copy), see snapshot()
+        self.scaled_misses = 0
+        self.frames = 0
+        self.last_frame = {'blits': 0, 'calls': 0, 'batches': 0, 'layers': 0}
+
+    def set_scale(self, scale):
+        """Change the render scale (drops the scaled surfaces)"""
+        if scale != self.scale:
+            self.scale = scale
+            self._scaled.clear()
+
+    def begin(self):
+        """Start a new frame (drops entries that were never flushed)"""
+        self.entries.clear()
+
+    def add(self, layer, surface, dest, area=None, version=0, alpha=None):
+        """
+        Queue a blit.
+
+        Args:
+            layer (int): One of the layer constants of this module
+            surface (pygame.Surface): Source
+            dest (tuple | pygame.Rect): Screen position
+            area (pygame.Rect): Optional part of the source to draw
+            version (int): Bump it when the surface is redrawn in place,
+                so its scaled copy (or texture) is rebuilt
+            alpha (int): Draw at this alpha (0-255) instead of the surface's own
+        """
+        self.entries.append((layer, BLIT, (surface, dest, area, version, alpha)))
+
+    def add_rect(self, layer, color, rect, width=0, border_radius=0):
+        """
+        Queue a filled (width 0) or outlined rect, like pygame.draw.rect().
+
+        Args:
+            layer (int): One of the layer constants of this module
+            color (tuple): RGB color
+            rect (tuple | pygame.Rect): Logical rect
+            width (int): Outline width, 0 fills
+            border_radius (int): Corner radius
+        """
+        self.entries.append((layer, RECT, (color, rect, width, border_radius)))
+
+    def add_sprite(self, layer, source, center, angle=0.0, scale=1.0, shadow=False):
+        """
+        Queue an unrotated source drawn rotated / scaled by the backend.
+        Only for lists with transforms set; the blit flush does not draw them.
+
+        Args:
+            layer (int): One of the layer constants of this module
+            source (pygame.Surface): Unrotated image
+            center (tuple): Logical center position
+            angle (float): Counter-clockwise degrees, like pygame.transform.rotate()
+            scale (float): Zoom
+            shadow (bool): Draw as a flat SHADOW_ALPHA black silhouette
+        """
+        self.entries.append((layer, SPRITE, (source, center, angle, scale, shadow)))
+
+    def take(self):
+        """Queued entries sorted by layer (stable); the list is empty afterwards"""
+        entries = sorted(self.entries, key=itemgetter(0))
+        self.entries.clear()
+        return entries
+
+    def snapshot(self):
+        """
+        Queued entries as an immutable frame for another thread; the list is empty afterwards.
+        Surfaces redrawn in place (version > 0) are replaced by a copy made once per version.
+        Every other queued surface must stay unchanged once it is submitted (fading
+        popups pass their alpha to add() instead of calling set_alpha()).
+        """
+        entries = self.take()
+        for i, (layer, kind, data) in enumerate(entries):
+            if kind != BLIT or not data[3]:
+                continue
+            surface, dest, area, version, alpha = data
+            frozen = self._frozen.get(id(surface))
+            if frozen is None or frozen[0] != version or frozen[1] is not surface:
+                frozen = (version, surface, surface.copy())
+                self._frozen[id(surface)] = frozen
+            entries[i] = (layer, kind, (frozen[2], dest, area, version, alpha))
+        return tuple(entries)
+
+    def end_frame(self, entries, blits, calls, batches):
+        """Record the counters of a flushed frame (also used by other backends)"""
+        self.last_frame = {'blits': blits, 'calls': calls, 'batches': batches,
+                           'layers': len({e[0] for e in entries})}
+        self.frames += 1
+
+    def flush(self, screen):
+        """
+        Draw every queued entry, bottom layer first, and clear the list.
+
+        Args:
+            screen (pygame.Surface): Target
+        """
+        self.draw_entries(screen, self.take())
+
+    def draw_entries(self, screen, entries):
+        """
+        Draw entries from take() or snapshot().
+
+        Args:
+            screen (pygame.Surface): Target
+            entries (sequence): (layer, kind, data) sorted by layer
+        """
+        blits = calls = batches = 0
+        batch = []
+        plain = True    # batch has no area rects (fblits only takes (surface, dest))
+        scale = self.scale
+        for layer, kind, data in entries:
+            if kind == BLIT:
+                surface, dest, area, version, alpha = data
+                if scale != 1.0 or alpha is not None:
+                    surface = self._get_scaled(surface, version, alpha)
+                if scale != 1.0:
+                    dest = (round(dest[0] * scale), round(dest[1] * scale))
+                    area = area and scale_rect(area, scale)
+                if alpha is not None:
+                    # private copy at this entry's alpha: draw it before the next entry changes it
+                    if batch:
+                        self._submit(screen, batch, plain)
+                        blits += len(batch); batches += 1
+                        batch = []; plain = True
+                    screen.blit(surface, dest, area)
+                    blits += 1; batches += 1
+                    continue
+                if area is None:
+                    batch.append((surface, dest))
+                else:
+                    batch.append((surface, dest, area))
+                    plain = False
+                continue
+            if batch:
+                self._submit(screen, batch, plain)
+                blits += len(batch); batches += 1
+                batch = []; plain = True
+            if kind == RECT:
+                color, rect, width, radius = data
+                width = width and max(1, round(width * scale))
+                pygame.draw.rect(screen, color, scale_rect(rect, scale), width,
+                                 border_radius=max(1, round(radius * scale)) if radius else 0)
+                calls += 1
+        if batch:
+            self._submit(screen, batch, plain)
+            blits += len(batch); batches += 1
+        self.end_frame(entries, blits, calls, batches)
+
+    def _get_scaled(self, surface, version, alpha=None):
+        """Copy of surface at the render scale (also at scale 1 for own-alpha entries), made once per version"""
+        key = (id(surface), version)
+        entry = self._scaled.get(key)
+        if entry is not None and entry[0] is surface:
+            self._scaled.move_to_end(key)
+            scaled = entry[1]
+        else:
+            self.scaled_misses += 1
+            width, height = surface.get_size()
+            size = (max(1, round(width * self.scale)), max(1, round(height * self.scale)))
+            # smoothscale needs 24/32 bit pixels and would blend the colorkey into the edges
+            if surface.get_bitsize() >= 24 and surface.get_colorkey() is None:
+                scaled = pygame.transform.smoothscale(surface, size)
+            else:
+                scaled = pygame.transform.scale(surface, size)
+            self._scaled[key] = (surface, scaled)   # keeping the source keeps its id unique
+            if len(self._scaled) > self.cache_size:
+                self._scaled.popitem(last=False)
+        # copies are shared by entries with their own alpha and plain ones
+        if alpha is None:
+            alpha = surface.get_alpha()
+        if scaled.get_alpha() != alpha:
+            scaled.set_alpha(alpha)
+        return scaled
+
+    @staticmethod
+    def _submit(screen, batch, plain):
+        """One C call for a run of blits"""
+        fblits = getattr(screen, 'fblits', None)
+        if plain and fblits is not None:
+            fblits(batch)
+        else:
+            screen.blits(batch, doreturn=False)
+
+    def stats(self):
+        """Counters of the last flushed frame"""
+        return dict(self.last_frame, frames=self.frames, scaled=len(self._scaled), scaled_misses=self.scaled_misses)
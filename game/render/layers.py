@@ -0,0 +1,118 @@
+"""
+Layer Compositor - cached surfaces for parts of the screen that rarely change
+The static base (background) is one surface queued at the bottom of a frame.
+Other layers cover a fixed screen rect and are re-composited only when their
+key changes (e.g. HUD values, button hover states), so an
+unchanged layer costs one blit.
+"""
+
+import pygame
+from game.managers.asset_manager import asset_manager
+
+
+class Layer:
+    """One cached, cropped part of the screen."""
+
+    def __init__(self, rect, build, alpha):
+        """
+        Args:
+            rect (pygame.Rect): Screen area the layer covers
+            build (callable): build(surface, offset) draws the layer content;
+                offset (dx, dy) turns screen positions into layer positions
+            alpha (bool): Layer has transparent parts (drawn over other layers)
+        """
+        self.rect = pygame.Rect(rect)
+        self.build = build
+        self.alpha = alpha
+        self.surface = None
+        self.key = None
+        self.dirty = True
+        self.version = 0    # bumped by every rebuild (the surface is redrawn in place)
+
+
+class LayerCompositor:
+    """Static base + keyed layers."""
+
+    def __init__(self):
+        self.base = None
+        self.base_key = None
+        self.layers = {}    # name -> Layer
+        self.rebuilds = 0
+        self.blits = 0
+
+    def set_base(self, image, fill_color, size):
+        """
+        Use image as the static base, or a surface filled with fill_color when
+        there is no image. Cheap to call every frame: only rebuilds on change.
+
+        Args:
+            image (pygame.Surface): Background at full screen size, or None
+            fill_color (tuple): Fallback color
+            size (tuple): Screen size
+        """
+        key = (id(image), fill_color, size) if image is not None else (None, fill_color, size)
+        if key == self.base_key:
+            return
+        self.base_key = key
+        if image is not None:
+            self.base = image   # already a display-format surface, no copy
+        else:
+            base = pygame.Surface(size)
+            base.fill(fill_color)
+            self.base = asset_manager.prepare_surface(base)
+        self.rebuilds += 1
+
+    def add(self, name, rect, build, alpha=True):
+        """
+        Register a layer (replaces a layer of the same name).
+
+        Args:
+            name (str): Layer name used by submit()
+            rect (pygame.Rect): Screen area the layer covers
+            build (callable): build(surface, offset), see Layer
+            alpha (bool): Layer has transparent parts
+        """
+        self.layers[name] = Layer(rect, build, alpha)
+
+    def submit_base(self, draw_list, draw_layer):
+        """Queue the static base on a frame draw list."""
+        draw_list.add(draw_layer, self.base, (0, 0))
+        self.blits += 1
+
+    def submit(self, draw_list, draw_layer, name, key):
+        """
+        Queue a layer on a frame draw list, re-compositing it first if key changed.
+
+        Args:
+            draw_list (DrawList): Frame draw list
+            draw_layer (int): Draw list layer
+            name (str): Layer name
+            key: Any comparable value describing the layer content
+        """
+        layer = self._current(name, key)
+        draw_list.add(draw_layer, layer.surface, layer.rect.topleft, version=layer.version)
+        self.blits += 1
+
+    def _current(self, name, key):
+        """Layer by name, rebuilt if its key changed"""
+        layer = self.layers[name]
+        if layer.dirty or key != layer.key:
+            self._rebuild(layer)
+            layer.key = key
+            layer.dirty = False
+        return layer
+
+    def _rebuild(self, layer):
+        """Redraw a layer into its own surface (allocated once)."""
+        if layer.surface is None:
+            flags = pygame.SRCALPHA if layer.alpha else 0
+            layer.surface = asset_manager.prepare_surface(pygame.Surface(layer.rect.size, flags))
+        if layer.alpha:
+            layer.surface.fill((0, 0, 0, 0))
+        layer.build(layer.surface, (-layer.rect.x, -layer.rect.y))
+        layer.version += 1
+        self.rebuilds += 1
+
+    def stats(self):
+        """Rebuild and blit counters"""
+        return {'layers': len(self.layers), 'rebuilds': self.rebuilds, 'blits': self.blits}
@@ -0,0 +1,180 @@
+"""
+Render Thread - draws published frame snapshots while the main thread simulates
+The main thread handles events, runs update(dt), queues the frame on the draw
+list and publishes the sorted entries as an immutable snapshot. This thread
+draws the newest snapshot into the render surface; snapshots that were
+replaced before it got to them are dropped (double buffering: one frame
+drawing, one waiting). The window belongs to the main thread, so a drawn frame
+is presented there, at the start of the next tick, before the thread may draw
+again. pygame releases the GIL inside blits, so drawing and the next update
+really run side by side; stats() reports how much their busy time overlaps.
+"""
+
+import threading
+import time
+from collections import deque
+
+
+def overlap_seconds(a, b):
+    """
+    Total time covered by both interval lists.
+
+    Args:
+        a, b (iterable): (start, end) pairs, each list sorted and non-overlapping
+    """
+    a, b = list(a), list(b)
+    total = 0.0
+    i = j = 0
+    while i < len(a) and j < len(b):
+        start = max(a[i][0], b[j][0])
+        end = min(a[i][1], b[j][1])
+        if end > start:
+            total += end - start
+        if a[i][1] < b[j][1]:
+            i += 1
+        else:
+            j += 1
+    return total
+
+
+class RenderThread:
+    """Worker that draws the latest snapshot, with busy-time bookkeeping for both threads."""
+
+    def __init__(self, draw, history=600):
+        """
+        Args:
+            draw (callable): draw(snapshot) renders one frame (runs on the thread, must not present)
+            history (int): Busy intervals kept per thread for the overlap numbers
+        """
+        self.draw = draw
+        self._pending = None            # newest snapshot not drawn yet
+        self._drawing = False
+        self._drawn = False             # a drawn frame waits for present_drawn()
+        self._cond = threading.Condition()
+        self._thread = None
+        self._running = False
+        self.error = None               # exception that stopped the thread
+
+        # stats
+        self.published = 0
+        self.drawn = 0
+        self.dropped = 0
+        self.presented = 0
+        self.main_busy = deque(maxlen=history)      # (start, end) of main thread ticks
+        self.render_busy = deque(maxlen=history)    # (start, end) of drawn frames
+
+    @property
+    def failed(self):
+        """True if drawing raised, the caller should go back to the serial loop"""
+        return self.error is not None
+
+    def start(self):
+        """Start the worker thread"""
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name='render', daemon=True)
+        self._thread.start()
+
+    def publish(self, snapshot):
+        """
+        Hand a frame to the thread, replacing one that is still waiting.
+
+        Args:
+            snapshot (tuple): Immutable frame description passed to draw()
+        """
+        with self._cond:
+            if self._pending is not None:
+                self.dropped += 1
+            self._pending = snapshot
+            self.published += 1
+            self._cond.notify()
+
+    def present_drawn(self, present):
+        """
+        Show the frame the thread finished, if there is one (main thread only).
+        The thread waits for this before it draws the next frame into the same surface.
+
+        Args:
+            present (callable): Shows the render surface, e.g. viewport.present
+
+        Returns:
+            bool: True if a frame was shown
+        """
+        with self._cond:
+            if not self._drawn:
+                return False
+            present()
+            self._drawn = False
+            self.presented += 1
+            self._cond.notify_all()
+            return True
+
+    def record_main(self, start, end):
+        """Busy interval of a main thread tick (perf_counter seconds)"""
+        self.main_busy.append((start, end))
+
+    def wait_idle(self):
+        """
+        Block until the thread is not drawing (before drawing on the main thread).
+        A frame still waiting to be drawn or presented is dropped.
+        """
+        with self._cond:
+            if self._pending is not None:
+                self._pending = None
+                self.dropped += 1
+            while self._running and self._drawing:
+                self._cond.wait()
+            self._drawn = False
+            self._cond.notify_all()
+
+    def stop(self):
+        """Finish the frame in progress and stop the thread"""
+        with self._cond:
+            self._running = False
+            self._pending = None
+            self._cond.notify_all()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join()
+        self._thread = None
+
+    def _run(self):
+        """Thread loop: wait for a snapshot (and for the last frame to be presented), draw it"""
+        while True:
+            with self._cond:
+                while self._running and (self._pending is None or self._drawn):
+                    self._cond.wait()
+                if not self._running:
+                    return
+                snapshot, self._pending = self._pending, None
+                self._drawing = True
+            start = time.perf_counter()
+            try:
+                self.draw(snapshot)
+            except Exception as e:
+                print(f"Failed to draw on the render thread: {e}")
+                self.error = e
+            end = time.perf_counter()
+            with self._cond:
+                self.render_busy.append((start, end))
+                self.drawn += 1
+                self._drawing = False
+                if self.error is not None:
+                    self._running = False
+                else:
+                    self._drawn = True
+                self._cond.notify_all()
+
+    def stats(self):
+        """Frame counts and how much the threads' busy time overlaps"""
+        with self._cond:
+            main, render = list(self.main_busy), list(self.render_busy)
+        busy = sum(end - start for start, end in render)
+        both = overlap_seconds(main, render)
+        return {
+            'published': self.published,
+            'drawn': self.drawn,
+            'dropped': self.dropped,
+            'presented': self.presented,
+            'render_ms': busy / len(render) * 1000 if render else 0.0,
+            'overlap_ms': both / len(render) * 1000 if render else 0.0,
+            'overlap': both / busy if busy else 0.0,
+        }
@@ -0,0 +1,151 @@
+"""
+Texture Backend - draws the frame draw list with an SDL2 renderer
+Optional alternative to blitting surfaces onto the display surface. Surfaces
+(items, npcs, belt, text, cached UI layers) are uploaded once as textures and
+drawn by pygame._sdl2.video.Renderer, which also does the rotation and zoom
+of items and the drag preview, and tints the same texture black for shadows.
+A hardware renderer is used where the machine has one, otherwise SDL's
+software renderer (GPU-less boxes). The renderer's logical size is the game's
+logical size, so the window can be any size.
+"""
+
+from collections import OrderedDict
+
+import pygame
+from config.settings import SHADOW_ALPHA, TEXTURE_CACHE_SIZE
+from game.render.draw_list import BLIT, RECT, SPRITE
+
+try:
+    from pygame._sdl2 import video
+except ImportError:     # pygame built without the SDL2 video module
+    video = None
+
+
+class TextureBackend:
+    """SDL2 window + renderer presenting draw lists, with a texture per surface."""
+
+    def __init__(self, size, title, cache_size=TEXTURE_CACHE_SIZE):
+        """
+        Args:
+            size (tuple): Logical size (and initial window size)
+            title (str): Window title
+            cache_size (int): Textures kept before the oldest is dropped
+
+        Raises:
+            pygame.error / video.error: No SDL2 video module or no renderer could be created
+        """
+        if video is None:
+            raise pygame.error("pygame._sdl2.video is not available")
+        self.size = tuple(size)
+        self.window = video.Window(title, size=self.size)
+
+        # 1. Hardware renderer if there is one, SDL's software renderer otherwise
+        try:
+            self.renderer = video.Renderer(self.window, accelerated=1)
+            self.accelerated = True
+        except video.error:
+            self.renderer = video.Renderer(self.window, accelerated=0)
+            self.accelerated = False
+        self.renderer.logical_size = self.size
+
+        self.cache_size = cache_size
+        self.textures = OrderedDict()   # (id, version) -> (surface, texture)
+        self.uploads = 0
+        self._frame = None              # streaming texture for screens drawn as a surface
+
+    def texture(self, surface, version=0):
+        """
+        Texture of a surface, uploaded on first use.
+
+        Args:
+            surface (pygame.Surface): Source, must not change unless version changes
+            version (int): See DrawList.add()
+        """
+        key = (id(surface), version)
+        entry = self.textures.get(key)
+        if entry is not None and entry[0] is surface:
+            self.textures.move_to_end(key)
+            return entry[1]
+        texture = video.Texture.from_surface(self.renderer, surface)
+        self.textures[key] = (surface, texture)     # keeping the source keeps its id unique
+        self.uploads += 1
+        if len(self.textures) > self.cache_size:
+            self.textures.popitem(last=False)
+        return texture
+
+    def present(self, draw_list):
+        """
+        Draw and show every queued entry of a draw list.
+
+        Args:
+            draw_list (DrawList): Frame draw list (entries in logical coordinates)
+        """
+        entries = draw_list.take()
+        renderer = self.renderer
+        renderer.draw_color = (0, 0, 0, 255)
+        renderer.clear()
+        draws = rects = 0
+        for layer, kind, data in entries:
+            if kind == BLIT:
+                surface, dest, area, version, alpha = data
+                texture = self.texture(surface, version)
+                if alpha is None:
+                    alpha = 255 if surface.get_alpha() is None else surface.get_alpha()
+                texture.alpha = alpha
+                if area is None:
+                    texture.draw(dstrect=(dest[0], dest[1], surface.get_width(), surface.get_height()))
+                else:
+                    area = pygame.Rect(area)
+                    texture.draw(srcrect=area, dstrect=(dest[0], dest[1], area.w, area.h))
+                draws += 1
+            elif kind == SPRITE:
+                self._draw_sprite(*data)
+                draws += 1
+            elif kind == RECT:
+                self._draw_rect(*data)
+                rects += 1
+        draw_list.end_frame(entries, draws, rects, 0)
+        renderer.present()
+
+    def present_surface(self, surface):
+        """Show a frame that was drawn into a surface (screens without a draw list)"""
+        if self._frame is None or self._frame.get_rect().size != surface.get_size():
+            self._frame = video.Texture(self.renderer, surface.get_size(), streaming=True)
+        self._frame.update(surface)
+        self.renderer.clear()
+        self._frame.draw()
+        self.renderer.present()
+
+    def _draw_sprite(self, source, center, angle, scale, shadow):
+        """Rotated / zoomed texture; shadows reuse it tinted black"""
+        texture = self.texture(source)
+        rect = pygame.Rect(0, 0, round(source.get_width() * scale), round(source.get_height() * scale))
+        rect.center = center
+        if shadow:
+            texture.color = pygame.Color(0, 0, 0)
+            texture.alpha = SHADOW_ALPHA
+        texture.draw(dstrect=rect, angle=-angle)    # the renderer turns clockwise
+        if shadow:
+            texture.color = pygame.Color(255, 255, 255)
+            texture.alpha = 255
+
+    def _draw_rect(self, color, rect, width, border_radius):
+        """pygame.draw.rect() counterpart (no rounded corners)"""
+        self.renderer.draw_color = pygame.Color(color)
+        rect = pygame.Rect(rect)
+        if not width:
+            self.renderer.fill_rect(rect)
+            return
+        for _ in range(width):
+            self.renderer.draw_rect(rect)
+            rect.inflate_ip(-2, -2)
+
+    def close(self):
+        """Destroy the window (textures go with the renderer)"""
+        self.textures.clear()
+        self._frame = None
+        self.window.destroy()
+
+    def stats(self):
+        """Texture cache numbers"""
+        return {'textures': len(self.textures), 'uploads': self.uploads, 'accelerated': self.accelerated}
@@ -0,0 +1,109 @@
+"""
+Viewport - logical game coordinates vs. the resolution frames are rendered at
+Every position in the game (CUSTOMER_SLOTS, DESK_AREA, button rects, ...) is
+in logical WINDOW_WIDTH x WINDOW_HEIGHT coordinates. Frames can be rendered at
+a smaller RENDER_RESOLUTION (e.g. half size on weak machines) and are then
+brought to the window size in one step:
+    'scaled'    pygame.SCALED, the window / fullscreen scaling is done by SDL
+    'software'  the render canvas is scaled into the window once per frame
+Mouse positions are mapped back to logical coordinates by mouse_pos().
+"""
+
+import pygame
+from config.settings import WINDOW_WIDTH, WINDOW_HEIGHT, RENDER_RESOLUTION, OUTPUT_SCALING, FULLSCREEN
+
+
+class Viewport:
+    """Display setup and coordinate mapping between logical, render and window space."""
+
+    def __init__(self, logical_size=(WINDOW_WIDTH, WINDOW_HEIGHT)):
+        """
+        Args:
+            logical_size (tuple): Size every game coordinate is written for
+        """
+        self.logical_size = tuple(logical_size)
+        self.render_size = self.logical_size
+        self.scaling = OUTPUT_SCALING
+        self.scale = 1.0            # render pixels per logical pixel
+        self.window = None          # display surface
+        self.screen = None          # surface frames are rendered into
+        self._logical_canvas = None
+
+    def open(self, render_size=RENDER_RESOLUTION, scaling=OUTPUT_SCALING, fullscreen=FULLSCREEN):
+        """
+        Open (or reopen) the display.
+
+        Args:
+            render_size (tuple): Render resolution, same aspect ratio as the logical size
+            scaling (str): 'scaled' or 'software', only used when render_size differs
+            fullscreen (bool): Fill the desktop
+
+        Returns:
+            pygame.Surface: Surface to render frames into
+        """
+        self.render_size = tuple(render_size)
+        self.scaling = scaling
+        self.scale = self.render_size[0] / self.logical_size[0]
+        flags = pygame.FULLSCREEN if fullscreen else 0
+        self._logical_canvas = None
+
+        # 1. Native resolution: render straight into the window
+        if self.render_size == self.logical_size and not fullscreen:
+            self.window = pygame.display.set_mode(self.logical_size)
+            self.screen = self.window
+            return self.screen
+
+        # 2. SDL scales the render-size window to the window / desktop
+        if scaling == 'scaled':
+            try:
+                self.window = pygame.display.set_mode(self.render_size, flags | pygame.SCALED)
+                self.screen = self.window
+                return self.screen
+            except pygame.error as e:
+                print(f"Failed to open a scaled display, scaling in software: {e}")
+                self.scaling = 'software'
+
+        # 3. Logical-size window (or desktop), canvas scaled in software
+        self.window = pygame.display.set_mode((0, 0) if fullscreen else self.logical_size, flags)
+        self.screen = pygame.Surface(self.render_size).convert()
+        return self.screen
+
+    @property
+    def software(self):
+        """True if present() has to scale the canvas into the window"""
+        return self.screen is not self.window
+
+    def logical_canvas(self):
+        """
+        Logical-size surface for screens drawn without a draw list (menus),
+        scaled to the render size by present_logical().
+        """
+        if self.scale == 1.0:
+            return self.screen
+        if self._logical_canvas is None:
+            self._logical_canvas = pygame.Surface(self.logical_size).convert()
+        return self._logical_canvas
+
+    def present_logical(self, canvas):
+        """Scale a logical_canvas() frame to the render surface (no-op at native resolution)"""
+        if canvas is not self.screen:
+            pygame.transform.smoothscale(canvas, self.render_size, self.screen)
+
+    def present(self):
+        """Show the rendered frame"""
+        if self.software:
+            pygame.transform.scale(self.screen, self.window.get_size(), self.window)
+        pygame.display.flip()
+
+    def mouse_pos(self):
+        """Mouse position in logical coordinates"""
+        x, y = pygame.mouse.get_pos()
+        if self.software:
+            width, height = self.window.get_size()
+            return (int(x * self.logical_size[0] / width), int(y * self.logical_size[1] / height))
+        if self.scale != 1.0:
+            return (int(x / self.scale), int(y / self.scale))
+        return (x, y)
+
+
+viewport = Viewport()
@@ -6,6 +6,8 @@ import pygame
 import sys
 from config.settings import *
 from game.ui.button import Button
+from game.managers.asset_manager import asset_manager
+from game.render.viewport import viewport
 
 
 class GameOverState:
@@ -16,8 +18,8 @@ class GameOverState:
         self.money = self.game_manager.game_data.get('money', 0)
 
         # Initialize fonts and img
-        self.font_title = pygame.font.Font(FONT_PATH, 80)
-        self.font_text = pygame.font.Font(FONT_PATH, 40)
+        self.font_title = asset_manager.font(FONT_PATH, 80)
+        self.font_text = asset_manager.font(FONT_PATH, 40)
         self.background = None
         self._load_background()
         start_x = WINDOW_WIDTH // 2
@@ -30,10 +32,15 @@ class GameOverState:
 
     def _load_background(self):
         """Load background"""
-        self.background = pygame.transform.scale(
-            pygame.image.load(ASSETS['bg_game_over']),
-            (WINDOW_WIDTH, WINDOW_HEIGHT)
-        )
+        try:
+            self.background = asset_manager.image(ASSETS['bg_game_over'], (WINDOW_WIDTH, WINDOW_HEIGHT))
+        except Exception as e:
+            print(f"Failed to load the game over background: {e}")
+
+    def release_assets(self):
+        """Drop the background when leaving (low-memory tiers)"""
+        self.background = None
+        asset_manager.release(ASSETS['bg_game_over'])
 
     def _to_main_menu(self):
         """Back to menu"""
@@ -48,16 +55,20 @@ class GameOverState:
     def handle_event(self, event):
         """Handle mouse event"""
         if event.type == pygame.MOUSEBUTTONDOWN:
-            mouse_pos = pygame.mouse.get_pos()
+            mouse_pos = viewport.mouse_pos()
             self.btn_menu.handle_click(mouse_pos)
             self.btn_quit.handle_click(mouse_pos)
 
     def update(self, dt):
         """Update mouse event"""
-        mouse_pos = pygame.mouse.get_pos()
+        mouse_pos = viewport.mouse_pos()
         self.btn_menu.update(mouse_pos)
         self.btn_quit.update(mouse_pos)
 
+    def dirty_regions(self):
+        """Only the buttons change on this screen (dirty rect renderer)"""
+        return {btn: btn.dirty_region() for btn in (self.btn_menu, self.btn_quit)}
+
     def render(self, screen):
         """Render"""
         # 1. render background
@@ -9,8 +9,17 @@ from config.settings import *
 from game.entities.item import Item
 from game.entities.customer import Customer
 from game.managers.inventory_manager import InventoryManager
+from game.managers.asset_manager import asset_manager
+from game.managers.audio_manager import audio_manager
 from game.ui.hud import HUD
-from game.ui.popup import FloatingText
+from game.ui.popup import PopupLayer
+from game.managers.text_cache import text_cache
+from game.render.layers import LayerCompositor
+from game.render.belt_strip import BeltStrip
+from game.render.culling import Culler
+from game.render import draw_list as draw
+from game.render.draw_list import DrawList
+from game.render.viewport import viewport
 from game.ui.button import Button
 from game.entities.sticky_note import StickyNote
 from game.entities.police import Police
@@ -45,21 +54,25 @@ class GameplayState:
 
         # 4. Initialize ui
         self.conveyor_texture = None
+        self.belt_strip = None  # pre-tiled belt, see _load_conveyor_texture()
         self.scroll_offset = 0
         self.scroll_speed = CONVEYOR_SPEED
         self.belt_width = 160   # to put items in the middle
         self.hud = HUD()
-        self.popups = []
+        self.popups = PopupLayer()
         self._load_background()
         self._load_conveyor_texture()
+        self.label_image = None
         try:
-            self.label_image = pygame.image.load('assets/images/icons/label.png')
+            self.label_image = asset_manager.image(ASSETS['icon_label'])
         except Exception as e:
-            print(f"Failed to load the conveyor belt image: {e}")
+            print(f"Failed to load the label image: {e}")
         self.dragging_item = None
         self.drag_offset = (0, 0)   # prevent items from drifting
+        self.drag_preview = None    # (scaled image, scaled shadow), built when a drag starts
         self.hovered_item = None    # for tooltip
-        self.font_small = pygame.font.Font(FONT_PATH, 24)
+        self._hover_key = None      # inputs of the last hover check
+        self._tooltip_cache = {}    # (item_type, name) -> tooltip surface
 
         self.call_police_btn = Button(1430, 570, 130, 70,
                                       "Call Police", None, style='danger', font_size=27
@@ -67,27 +80,22 @@ class GameplayState:
         self.menu_btn = Button(1430, 835, 130, 50,
                                "BACK", None, style='transparent', font_size=42)
         self.spray_btn = Button(
-            1470, 400, 50, 150,
+            1470, 400, *SPRAY_BUTTON_SIZE,
             None, None, style='transparent', image_path=ASSETS.get('item_spray')
         )
 
-        # 5. Initialize sound effect
-        try:
-            self.sfx_money = pygame.mixer.Sound(SOUNDS['sfx_money'])
-            self.sfx_deny = pygame.mixer.Sound(SOUNDS['sfx_deny'])
-            self.sfx_click = pygame.mixer.Sound(SOUNDS['sfx_click'])
-            self.sfx_pick = pygame.mixer.Sound(SOUNDS['sfx_pick'])
-            self.sfx_drop = pygame.mixer.Sound(SOUNDS['sfx_drop'])
-            self.sfx_spray = pygame.mixer.Sound(SOUNDS['sfx_spray'])
-
-            self.sfx_money.set_volume(1.0)
-            self.sfx_deny.set_volume(0.6)
-            self.sfx_click.set_volume(0.8)
-            self.sfx_pick.set_volume(0.8)
-            self.sfx_drop.set_volume(0.2)
-            self.sfx_spray.set_volume(1.0)
-        except Exception as e:
-            print(f"Failed to load the sfx: {e}")
+        # Cached screen layers: background base, buttons + hud
+        self.layers = LayerCompositor()
+        self._init_layers()
+        self.culler = Culler()      # skips items / npc outside the window (or dirty box)
+
+        # 5. Sound effect handles (decoded once in the shared bank, volumes in SFX_SETTINGS)
+        self.sfx_money = audio_manager.sound('sfx_money')
+        self.sfx_deny = audio_manager.sound('sfx_deny')
+        self.sfx_click = audio_manager.sound('sfx_click')
+        self.sfx_pick = audio_manager.sound('sfx_pick')
+        self.sfx_drop = audio_manager.sound('sfx_drop')
+        self.sfx_spray = audio_manager.sound('sfx_spray')
 
         # 5. Calling private method and music
         self._init_game()
@@ -97,27 +105,29 @@ class GameplayState:
         Generate the first batch of items and customer
         """
         # Play BGM
-        try:
-            pygame.mixer.music.load(SOUNDS['bgm_menu'])
-            pygame.mixer.music.set_volume(0.35)
-            pygame.mixer.music.play(-1)
-        except Exception as e:
-            print(f"Failed to play BGM: {e}")
+        audio_manager.play_music(SOUNDS['bgm_menu'], 0.35)
 
         self._spawn_item_on_conveyor()  # generate the first batch
 
     def _load_background(self):
         """load background image"""
-        self.background = pygame.transform.scale(
-            pygame.image.load(ASSETS['bg_main']),
-            (WINDOW_WIDTH, WINDOW_HEIGHT)
-        )
+        self.background = None
+        try:
+            self.background = asset_manager.image(ASSETS['bg_main'], (WINDOW_WIDTH, WINDOW_HEIGHT))
+        except Exception as e:
+            print(f"Failed to load the background image: {e}")
+
+    def release_assets(self):
+        """Drop the background when leaving (low-memory tiers)"""
+        self.background = None
+        asset_manager.release(ASSETS['bg_main'])
 
     def _load_conveyor_texture(self):
         """load conveyor_texture image"""
         try:
-            self.conveyor_texture = pygame.image.load('assets/images/conveyor_belt.png')
+            self.conveyor_texture = asset_manager.image(ASSETS['conveyor_belt'])
             self.belt_width = self.conveyor_texture.get_width()
+            self.belt_strip = BeltStrip(self.conveyor_texture, CONVEYOR_LANES, WINDOW_HEIGHT)
         except Exception as e:
             print(f"Failed to load the conveyor belt image: {e}")
 
@@ -131,7 +141,7 @@ class GameplayState:
         """
         Handles player input events (Mouse clicks, dragging, and releasing).
         """
-        mouse = pygame.mouse.get_pos()
+        mouse = viewport.mouse_pos()
         self.call_police_btn.update(mouse)
         self.menu_btn.update(mouse)
         self.spray_btn.update(mouse)
@@ -188,6 +198,7 @@ class GameplayState:
                 self.dragging_item = item
                 self.dragging_item.is_selected = True
                 self.drag_offset = (mouse[0] - item.x, mouse[1] - item.y)
+                self.drag_preview = self._make_drag_preview(item)
 
         # 2. Release (check delivery process)
         elif event.type == pygame.MOUSEBUTTONUP and event.button == 1 and self.dragging_item:
@@ -208,6 +219,7 @@ class GameplayState:
                 self.dragging_item.set_position(mouse[0] - self.drag_offset[0], mouse[1] - self.drag_offset[1])
                 self.inventory_manager.add_item_to_desk(self.dragging_item)
             self.dragging_item = None
+            self.drag_preview = None
 
     def update(self, dt):
         """update game status"""
@@ -258,19 +270,10 @@ class GameplayState:
 
         # 6.UI update
         # -6.1. Check popup state
-        for p in self.popups[:]:
-            if not p.update(dt): self.popups.remove(p)
+        self.popups.update(dt)
 
         # -6.2. Check status for hover(tooltip)
-        mouse = pygame.mouse.get_pos()
-        if not self.dragging_item:
-            self.hovered_item = None
-            # Check conveyor first, then desktop
-            for i in self.conveyor_items:
-                if i.contains_point(mouse): self.hovered_item = i; break
-            if not self.hovered_item:
-                self.hovered_item = self.inventory_manager.get_item_at_position(mouse)
-        else: self.hovered_item = None
+        self._update_hover()
 
         # -6.3. Determine whether conveyor belt scroll
         should_scroll = False
@@ -284,36 +287,80 @@ class GameplayState:
         self.inventory_manager.update(dt)
 
     def render(self, screen):
-        # 1. Render background and belt texture
-        if self.background: screen.blit(self.background, (0,0))
-        else: screen.fill(COLOR_GRAY)
-        self._render_conveyor_belt(screen)
+        """Draw the frame on its own (the game loop uses submit() with the shared draw list)"""
+        draw_list = DrawList()
+        self.submit(screen, draw_list)
+        draw_list.flush(screen)
 
-        # 2. Render items
-        for i in self.conveyor_items:
-            self._draw_item_shadow(screen, i)
-            i.render(screen)
-        for i in self.inventory_manager.desk_items:
-            self._draw_item_shadow(screen, i)
-        self.inventory_manager.render(screen)
-
-        # 3. Render npc
-        for c in self.customers: c.render(screen)
-
-        # 4. Render UI
-        self.call_police_btn.render(screen)     # call_police
-        self.spray_btn.render(screen)           # spray
-        self.menu_btn.render(screen)            # back to menu
-        for p in self.popups: p.render(screen)  # popups info
-        self.hud.render(screen, self.money, self.shift_time, self.shift_duration)   # hud
-        # Label: If dragging, scale img of items
-        if self.dragging_item:
-            scale_rate = 1.2
-            self._draw_item_shadow(screen, self.dragging_item, (20,20), scale_rate)
-            scale_image = pygame.transform.rotozoom(self.dragging_item.image, 0, scale_rate)
-            screen.blit(scale_image, scale_image.get_rect(center=self.dragging_item.get_rect().center))
+    def submit(self, screen, draw_list):
+        """
+        Queue the whole frame on a draw list, sorted into layers when it is flushed.
+
+        Args:
+            screen (pygame.Surface): Target, its clip rect is the visible area for culling
+            draw_list (DrawList): Frame draw list
+        """
+        # 1. Background (static base) and belt texture
+        self.layers.set_base(self.background, COLOR_GRAY, (WINDOW_WIDTH, WINDOW_HEIGHT))
+        self.layers.submit_base(draw_list, draw.BACKGROUND)
+        self._render_conveyor_belt(draw_list)
+
+        # 2. Items that can reach the screen (conveyor batches queue above the window)
+        self.culler.begin(screen, draw_list.scale)
+        for i in self.conveyor_items + self.inventory_manager.desk_items:
+            if self.culler.visible(self._item_bounds(i)):
+                self._draw_item_shadow(draw_list, i)
+                i.submit(draw_list, draw.ITEMS)
+
+        # 3. Npc (walking in from above the window)
+        for c in self.customers:
+            if self.culler.visible(c.dirty_region()[0]): c.submit(draw_list, draw.NPCS)
+
+        # 4. UI: buttons + hud from one cached layer, then popups
+        self.layers.submit(draw_list, draw.UI, 'ui', self._ui_layer_key())
+        self.popups.submit(draw_list, draw.UI)
+        # Label: If dragging, scaled img of the item (zoomed by the backend if it can)
+        if self.dragging_item and draw_list.transforms:
+            item = self.dragging_item
+            x, y = item.get_rect().center
+            draw_list.add_sprite(draw.DRAG, item.original_image, (x + DRAG_SHADOW_OFFSET[0], y + DRAG_SHADOW_OFFSET[1]),
+                                 item.angle, DRAG_SCALE, shadow=True)
+            draw_list.add_sprite(draw.DRAG, item.original_image, (x, y), item.angle, DRAG_SCALE)
+        elif self.dragging_item:
+            image, shadow = self.drag_preview
+            image_rect, shadow_rect = self._drag_preview_rects()
+            draw_list.add(draw.DRAG, shadow, shadow_rect)
+            draw_list.add(draw.DRAG, image, image_rect)
         # Label: If not, show the label
-        if self.hovered_item and not self.dragging_item: self._render_item_tooltip(screen)
+        if self.hovered_item and not self.dragging_item: self._render_item_tooltip(draw_list)
+
+    def dirty_regions(self):
+        """
+        Everything that can change on screen, for the dirty rect renderer.
+        Returns: dict key -> (rect, look)
+        """
+        regions = {}
+        # 1. Belt strip (scrolls as a whole)
+        if self.belt_strip:
+            regions['belt'] = (self.belt_strip.get_rect(), self.belt_strip.source_top(self.scroll_offset))
+
+        # 2. Items with their (5, 5) shadow, npc, buttons, popups, hud
+        for i in self.conveyor_items + self.inventory_manager.desk_items:
+            regions[i] = (self._item_bounds(i), i.dirty_region()[1])
+        for c in self.customers: regions[c] = c.dirty_region()
+        for b in (self.call_police_btn, self.spray_btn, self.menu_btn): regions[b] = b.dirty_region()
+        for p in self.popups: regions[p] = p.dirty_region()
+        regions['hud'] = self.hud.dirty_region(self.money, self.shift_time, self.shift_duration)
+
+        # 3. Drag preview or tooltip
+        if self.dragging_item:
+            image_rect, shadow_rect = self._drag_preview_rects()
+            regions['drag'] = (image_rect.union(shadow_rect), id(self.drag_preview[0]))
+        elif self.hovered_item:
+            tooltip = self._get_tooltip(self.hovered_item)
+            if tooltip is not None:
+                regions['tooltip'] = (self._tooltip_rect(tooltip), id(tooltip))
+        return regions
 
 
     #--------------------------------------------private_Methods------------------------------------------------
@@ -495,50 +542,123 @@ class GameplayState:
         UI, popup messages for player(warning, tips)
         param: x: posX, y: posY, text: content, c: color
         """
-        self.popups.append(FloatingText(x, y, text, c))
+        self.popups.spawn(x, y, text, c)
 
     # TODO AI Calculate the position of the conveyor belt texture
-    def _render_conveyor_belt(self, screen):
-        """UI, popup messages for player(warning, tips)"""
-        if not self.conveyor_texture: return
-
-        tex_h = self.conveyor_texture.get_height()
-        # Calculate the offset for vertical scrolling
-        y_offset = int(self.scroll_offset) % tex_h
-        draw_x = CONVEYOR_CENTER_X - self.belt_width // 2
-        for y in range(-tex_h, WINDOW_HEIGHT + tex_h, tex_h):
-            screen.blit(self.conveyor_texture, (draw_x, y + y_offset))
+    def _render_conveyor_belt(self, draw_list):
+        """UI, queue the scrolling belt (one blit from the pre-tiled strip)"""
+        if not self.belt_strip: return
+        self.belt_strip.submit(draw_list, draw.BELT, self.scroll_offset)
+
+    def _init_layers(self):
+        """Register the UI layer (its content is drawn by _build_ui_layer)"""
+        ui_rect = self.hud.dirty_region(0, 0, 0)[0]
+        for b in self._ui_buttons(): ui_rect = ui_rect.union(b.rect)
+        self.layers.add('ui', ui_rect, self._build_ui_layer)
+
+    def _ui_buttons(self):
+        """Buttons drawn in the UI layer"""
+        return (self.call_police_btn, self.spray_btn, self.menu_btn)
+
+    def _ui_layer_key(self):
+        """Everything the UI layer shows: hud strings and button looks"""
+        hud_key = self.hud.dirty_region(self.money, self.shift_time, self.shift_duration)[1]
+        return hud_key, tuple(b.dirty_region()[1] for b in self._ui_buttons())
+
+    def _build_ui_layer(self, surface, offset):
+        """Buttons and hud, same order as they used to be drawn on screen"""
+        for b in self._ui_buttons(): b.render(surface, offset)
+        self.hud.render(surface, self.money, self.shift_time, self.shift_duration, offset)
+
+    def _item_bounds(self, item):
+        """Screen rect of an item and its (5, 5) shadow"""
+        rect = item.get_rect()
+        return rect.union(rect.move(5, 5))
 
     # TODO AI Calculate the position of the item shadow
-    def _draw_item_shadow(self, screen, item, off=(5,5), sc=1.0):
-        """UI, Draw shadow for item"""
+    def _draw_item_shadow(self, draw_list, item, off=(5,5), sc=1.0):
+        """UI, Queue shadow for item (cached per item type, rotation and scale)"""
         if not item.image: return
-        img = item.image
-        if sc != 1.0: img = pygame.transform.scale(img, (int(img.get_width()*sc), int(img.get_height()*sc)))
-        try:
-            mask = pygame.mask.from_surface(img)
-            shad = mask.to_surface(setcolor=(0,0,0,100), unsetcolor=None)
-            if sc != 1.0:
-                r = shad.get_rect(center=item.get_rect().center); r.x+=off[0]; r.y+=off[1]; screen.blit(shad, r)
-            else: screen.blit(shad, (item.x+off[0], item.y+off[1]))
-        except: pass
+        if draw_list.transforms:
+            x, y = item.get_rect().center
+            draw_list.add_sprite(draw.SHADOWS, item.original_image, (x+off[0], y+off[1]), item.angle, sc, shadow=True)
+            return
+        shad = item.get_shadow(sc)
+        if sc != 1.0:
+            r = shad.get_rect(center=item.get_rect().center); r.x+=off[0]; r.y+=off[1]; draw_list.add(draw.SHADOWS, shad, r)
+        else: draw_list.add(draw.SHADOWS, shad, (item.x+off[0], item.y+off[1]))
+
+    def _make_drag_preview(self, item):
+        """Scaled sprite + shadow for the dragged item, made once when the drag starts"""
+        image = asset_manager.prepare_surface(pygame.transform.rotozoom(item.image, 0, DRAG_SCALE))
+        return image, item.get_shadow(DRAG_SCALE)
+
+    def _drag_preview_rects(self):
+        """Screen rects of the drag preview image and its shadow (centered on the item)"""
+        image, shadow = self.drag_preview
+        center = self.dragging_item.get_rect().center
+        shadow_rect = shadow.get_rect(center=center).move(DRAG_SHADOW_OFFSET)
+        return image.get_rect(center=center), shadow_rect
 
     # TODO AI Calculate the position of the tooltip
-    def _render_item_tooltip(self, screen):
-        """UI, Draw item tooltip"""
+    def _render_item_tooltip(self, draw_list):
+        """UI, Queue item tooltip"""
         if not self.hovered_item: return
-        mouse_pos = pygame.mouse.get_pos()
-        item_name = self.hovered_item.name
-        name_surf = self.font_small.render(item_name, True, COLOR_WHITE)
-
-        padding_x = 10; padding_y = 8
-        width = name_surf.get_width() + padding_x * 2; height = name_surf.get_height() + padding_y * 2
+        tooltip = self._get_tooltip(self.hovered_item)
+        if tooltip is None: return
+        draw_list.add(draw.TOOLTIP, tooltip, self._tooltip_rect(tooltip))
+
+    def _tooltip_rect(self, tooltip):
+        """Tooltip placement next to the mouse, kept inside the window"""
+        mouse_pos = viewport.mouse_pos()
+        width, height = tooltip.get_size()
         x = mouse_pos[0] + 20; y = mouse_pos[1] - 30
         if x + width > WINDOW_WIDTH: x = mouse_pos[0] - width - 10
         if y + height > WINDOW_HEIGHT: y = mouse_pos[1] - height - 10
+        return pygame.Rect(x, y, width, height)
+
+    def _get_tooltip(self, item):
+        """
+        Composited tooltip (label background + name) for an item, built on first hover.
+        Keyed by (item_type, name): one per item type, notes share "Case Note".
+        """
+        key = (item.item_type, item.name)
+        if key in self._tooltip_cache: return self._tooltip_cache[key]
+        tooltip = None
         if self.label_image:
-            bg = pygame.transform.scale(self.label_image, (width, height))
-            screen.blit(bg, (x, y))
-            text_x = x + (width - name_surf.get_width()) // 2
-            text_y = y + (height - name_surf.get_height()) // 2
-            screen.blit(name_surf, (text_x, text_y))
+            name_surf = text_cache.render(FONT_PATH, 24, item.name, COLOR_WHITE)
+            padding_x = 10; padding_y = 8
+            width = name_surf.get_width() + padding_x * 2; height = name_surf.get_height() + padding_y * 2
+            tooltip = pygame.Surface((width, height), pygame.SRCALPHA)
+            tooltip.blit(pygame.transform.scale(self.label_image, (width, height)), (0, 0))
+            tooltip.blit(name_surf, (padding_x, padding_y))
+            tooltip = asset_manager.prepare_surface(tooltip)
+        self._tooltip_cache[key] = tooltip
+        return tooltip
+
+    def _update_hover(self):
+        """
+        Find the item under the mouse. Skipped unless the mouse moved, the desk
+        changed or items can move under it. Runs every frame while desk items
+        slide, and while the belt scrolls with the mouse in the belt's column.
+        """
+        if self.dragging_item:
+            self.hovered_item = None; self._hover_key = None; return
+        mouse = viewport.mouse_pos()
+        if self.inventory_manager.items_moving:
+            key = None      # sliding desk items: no cheap key, always search
+        else:
+            # column covered by belt items (wide items stick out of CONVEYOR_AREA)
+            rects = [i.get_rect() for i in self.conveyor_items]
+            on_belt = bool(rects) and min(r.left for r in rects) <= mouse[0] < max(r.right for r in rects)
+            belt = (len(self.conveyor_items), self.scroll_offset) if on_belt else None
+            key = (mouse, belt, self.inventory_manager.version)
+            if key == self._hover_key: return
+        self._hover_key = key
+
+        self.hovered_item = None
+        # Check conveyor first, then desktop
+        for i in self.conveyor_items:
+            if i.contains_point(mouse): self.hovered_item = i; break
+        if not self.hovered_item:
+            self.hovered_item = self.inventory_manager.get_item_at_position(mouse)
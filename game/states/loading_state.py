@@ -0,0 +1,63 @@
+"""
+Loading status: progress bar while assets are decoded in the background
+"""
+
+import pygame
+from config.settings import *
+from game.managers.asset_manager import asset_manager
+from game.managers.asset_loader import AssetPreloader
+
+
+class LoadingState:
+    def __init__(self, game_manager):
+        """
+        Loading state, switches to the menu once every asset is ready
+
+        Args: game_manager: manage game status and data
+        """
+        self.game_manager = game_manager
+
+        # Only the font is loaded synchronously, everything else goes to the workers
+        self.font = asset_manager.font(FONT_PATH, 40)
+
+        self.bar_rect = pygame.Rect(0, 0, 600, 24)
+        self.bar_rect.center = (WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 40)
+
+        # Workers start once the first frame is on screen
+        self.preloader = AssetPreloader()
+        self.frame_shown = False
+
+    def handle_event(self, event):
+        """No input while loading"""
+        pass
+
+    def update(self, dt):
+        """Finalize decoded assets within the frame budget, then open the menu"""
+        if self.preloader.start_time is None:
+            if self.frame_shown:
+                self.preloader.start()
+            return
+
+        if self.preloader.finalize(PRELOAD_FRAME_BUDGET):
+            print(f"Assets loaded in {self.preloader.elapsed * 1000:.0f} ms "
+                  f"({self.preloader.total} files, {len(self.preloader.failed)} failed)")
+            self.game_manager.mark_startup('asset load')
+            from game.game_manager import GameState
+            self.game_manager.change_state(GameState.MENU)
+
+    def render(self, screen):
+        """Render"""
+        self.frame_shown = True
+        screen.fill(COLOR_BLACK)
+
+        # 1. Render title
+        percent = int(self.preloader.progress * 100)
+        text = self.font.render(f"Loading... {percent}%", True, COLOR_WHITE)
+        screen.blit(text, text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 20)))
+
+        # 2. Render progress bar (background + fill)
+        pygame.draw.rect(screen, COLOR_DARK_GRAY, self.bar_rect, border_radius=8)
+        fill = self.bar_rect.copy()
+        fill.width = int(self.bar_rect.width * self.preloader.progress)
+        if fill.width > 0:
+            pygame.draw.rect(screen, COLOR_YELLOW, fill, border_radius=8)
@@ -6,6 +6,9 @@ import pygame
 import sys
 from config.settings import *
 from game.ui.button import Button
+from game.managers.asset_manager import asset_manager
+from game.managers.audio_manager import audio_manager
+from game.render.viewport import viewport
 
 class MenuState:
     def __init__(self, game_manager):
@@ -17,12 +20,10 @@ class MenuState:
         self.game_manager = game_manager
 
         # Initialize UI
-        self.font_title = pygame.font.Font(FONT_PATH, 80)
-        self.font_subtitle = pygame.font.Font(FONT_PATH, 40)
-        self.background = pygame.transform.scale(
-            pygame.image.load(ASSETS['bg_menu']),
-            (WINDOW_WIDTH, WINDOW_HEIGHT)
-        )
+        self.font_title = asset_manager.font(FONT_PATH, 80)
+        self.font_subtitle = asset_manager.font(FONT_PATH, 40)
+        self.background = None
+        self._load_background()
 
         # Initialize button
         self.btn_width = 260
@@ -32,16 +33,28 @@ class MenuState:
         self.spacing = 70
         self.buttons = self._create_buttons()
 
-        self._play_menu_music()
+        self.play_menu_music()
 
-    def _play_menu_music(self):
-        """Play BGM"""
+    def _load_background(self):
+        """Load background"""
         try:
-            pygame.mixer.music.load(SOUNDS['bgm_menu'])
-            pygame.mixer.music.set_volume(0.7)
-            pygame.mixer.music.play(-1)
+            self.background = asset_manager.image(ASSETS['bg_menu'], (WINDOW_WIDTH, WINDOW_HEIGHT))
         except Exception as e:
-            print(f"Failed to play BGM: {e}")
+            print(f"Failed to load the menu background: {e}")
+
+    def release_assets(self):
+        """Drop the background while the menu is inactive (low-memory tiers)"""
+        self.background = None
+        asset_manager.release(ASSETS['bg_menu'])
+
+    def restore_assets(self):
+        """Reload what release_assets() dropped"""
+        if self.background is None:
+            self._load_background()
+
+    def play_menu_music(self):
+        """Play BGM (loaded on the music thread)"""
+        audio_manager.play_music(SOUNDS['bgm_menu'], 0.7)
 
     def _create_buttons(self):
         """Create buttons"""
@@ -73,16 +86,20 @@ class MenuState:
     def handle_event(self, event):
         """Handle mouse event"""
         if event.type == pygame.MOUSEBUTTONDOWN:
-            mouse_pos = pygame.mouse.get_pos()
+            mouse_pos = viewport.mouse_pos()
             for btn in self.buttons:
                 btn.handle_click(mouse_pos)
 
     def update(self, dt):
         """Update mouse event"""
-        mouse_pos = pygame.mouse.get_pos()
+        mouse_pos = viewport.mouse_pos()
         for btn in self.buttons:
             btn.update(mouse_pos)
 
+    def dirty_regions(self):
+        """Only the buttons change on the menu (dirty rect renderer)"""
+        return {btn: btn.dirty_region() for btn in self.buttons}
+
     def render(self, screen):
         """Render"""
         # 1. Render background
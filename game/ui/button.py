@@ -5,10 +5,15 @@ Supports styles: primary (blue), grey, danger (red), transparent
 
 import pygame
 from config.settings import COLOR_WHITE, COLOR_BLACK, COLOR_BLUE, COLOR_RED
+from game.managers.asset_manager import asset_manager
+from game.managers.text_cache import text_cache
 
 class Button:
     """Clickable button with customizable styles and callbacks"""
 
+    # look -> (normal face, hover face), shared by buttons that look the same
+    _face_cache = {}
+
     def __init__(self, x, y, width, height, text, callback,  
                 callback_arg=None, style='primary', font_size=36, image_path=None):
         """
@@ -38,12 +43,15 @@ class Button:
         self.is_hovered = False  # True when mouse is over button
         
         # Load font
+        self.font_size = font_size
         try:
             from config.settings import FONT_PATH
-            self.font = pygame.font.Font(FONT_PATH, font_size)
+            self.font = asset_manager.font(FONT_PATH, font_size)
+            self.font_path = FONT_PATH
         except:
             # If custom font fails, use system default font
-            self.font = pygame.font.Font(None, font_size)
+            self.font = asset_manager.font(None, font_size)
+            self.font_path = None
         
         # Apply visual style (sets colors and border width)
         self.apply_style(style)
@@ -52,10 +60,11 @@ class Button:
         self.image = None
         if image_path:
             try:
-                raw_img = pygame.image.load(image_path)
-                self.image = pygame.transform.scale(raw_img, (width, height))
+                self.image = asset_manager.image(image_path, (width, height))
             except Exception as e:
                 print(f"Failed to load button image: {image_path}, error: {e}")
+        if self.image is None:
+            self._build_faces()
     
     
     def apply_style(self, style):
@@ -72,6 +81,9 @@ class Button:
         """
         # Default border width
         self.border_width = 2
+        # new colors -> faces are rebuilt on the next render
+        self._faces = None
+        self._faces_key = None
         
         if style == 'transparent':
             # Transparent style (e.g., menu buttons)
@@ -144,56 +156,83 @@ class Button:
         self.is_hovered = self.rect.collidepoint(mouse_pos)
     
     
-    def render(self, screen):
+    def render(self, screen, offset=(0, 0)):
         """
         Draw button to screen
         
         Args:
             screen (pygame.Surface): Screen to draw on
+            offset (tuple): Added to the position (drawing into a cropped layer)
         
         Returns:
             None
         """
+        pos = (self.rect.x + offset[0], self.rect.y + offset[1])
         if self.image:
-            screen.blit(self.image, self.rect)
+            screen.blit(self.image, pos)
             return
 
-        # Step 1: Determine color based on state
-        if self.is_hovered:
-            color = self.color_hover
-        else:
-            color = self.color_normal
+        # Hover only picks the other pre-rendered face
+        if self._faces_key != (self.text, self.rect.size):
+            self._build_faces()
+        face = self._faces[1] if self.is_hovered else self._faces[0]
+        screen.blit(face, pos)
 
-        # Step 2: Draw background
-        # TODO 把变量 s 改成了 temp_surface
-        if len(color) == 4:
-            # RGBA: use temp surface for transparency
-            temp_surface = pygame.Surface(
-                (self.rect.width, self.rect.height), 
-                pygame.SRCALPHA
-            )
-            pygame.draw.rect(
-                temp_surface, 
-                color, 
-                temp_surface.get_rect(), 
-                border_radius=8
-            )
-            screen.blit(temp_surface, self.rect.topleft)
-        else:
-            # RGB: draw directly
-            pygame.draw.rect(screen, color, self.rect, border_radius=8)
+    def submit(self, draw_list, layer):
+        """
+        Queue the button on a frame draw list instead of drawing it now
+
+        Args:
+            draw_list (DrawList): Frame draw list
+            layer (int): Draw list layer
+        """
+        if self.image:
+            draw_list.add(layer, self.image, self.rect.topleft)
+            return
+        if self._faces_key != (self.text, self.rect.size):
+            self._build_faces()
+        draw_list.add(layer, self._faces[1] if self.is_hovered else self._faces[0], self.rect.topleft)
+
+    def dirty_region(self):
+        """Screen rect and current look, for the dirty rect renderer"""
+        return self.rect, (self.is_hovered, self.text)
+
+    def _build_faces(self):
+        """
+        Pre-render the normal and hover visuals (background, border, label).
+        Buttons with the same look share the surfaces (e.g. every "Don't Have").
+        """
+        size = self.rect.size
+        self._faces_key = (self.text, size)
+        key = (self.text, size, self.font_path, self.font_size, self.text_color,
+               self.color_normal, self.color_hover, self.border_width)
+        faces = Button._face_cache.get(key)
+        if faces is None:
+            faces = tuple(self._render_face(color, size)
+                          for color in (self.color_normal, self.color_hover))
+            Button._face_cache[key] = faces
+        self._faces = faces
+
+    def _render_face(self, color, size):
+        """
+        Draw one button state onto its own surface.
+
+        Args:
+            color (tuple): RGB or RGBA background color
+            size (tuple): Button (width, height)
+        """
+        face = pygame.Surface(size, pygame.SRCALPHA)
+        face_rect = face.get_rect()
+
+        # Step 1: Draw background (RGBA colors keep their transparency)
+        pygame.draw.rect(face, color, face_rect, border_radius=8)
 
-        # Step 3: Draw border
+        # Step 2: Draw border
         if self.border_width > 0:
-            pygame.draw.rect(
-                screen, 
-                COLOR_WHITE, 
-                self.rect, 
-                self.border_width, 
-                border_radius=8
-            )
+            pygame.draw.rect(face, COLOR_WHITE, face_rect, self.border_width, border_radius=8)
 
-        # Step 4: Draw text (centered)
-        text_surface = self.font.render(self.text, True, self.text_color)
-        text_rect = text_surface.get_rect(center=self.rect.center)
-        screen.blit(text_surface, text_rect)
+        # Step 3: Draw text (centered)
+        if self.text:
+            text_surface = text_cache.render(self.font_path, self.font_size, self.text, self.text_color)
+            face.blit(text_surface, text_surface.get_rect(center=face_rect.center))
+        return asset_manager.prepare_surface(face)
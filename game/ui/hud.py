@@ -5,6 +5,8 @@ Displays game information: money and remaining time
 
 import pygame
 from config.settings import *
+from game.managers.asset_manager import asset_manager
+from game.managers.text_cache import text_cache
 
 
 class HUD:
@@ -17,27 +19,41 @@ class HUD:
         Loads clock and money icons, scales them to specified size,
         and sets their positions on screen.
         """
-        # Load font for displaying values
-        self.font = pygame.font.Font(FONT_PATH, 36)
+        # Font for displaying values (rendered through the text cache)
+        self.font_size = 36
 
         # TODO 12.04修改替换
         # HUD element size (width, height)
-        self.hud_size = (130, 80)
+        self.hud_size = HUD_ICON_SIZE
 
         # TODO 12.04修改替换
         # HUD positions on screen (x, y from top-left)
         self.time_pos = (1430, 740)   # Time display position
         self.money_pos = (1430, 650)  # Money display position
 
-        # Load original icon images
-        raw_time_img = pygame.image.load('assets/images/icons/clock.png')
-        raw_money_img = pygame.image.load('assets/images/icons/money.png')
+        # Load icon images scaled to HUD size (shared through the asset manager)
+        self.bg_time = asset_manager.image(ASSETS['icon_clock'], self.hud_size)
+        self.bg_money = asset_manager.image(ASSETS['icon_money'], self.hud_size)
 
-        # Scale images to HUD size (Transform Scale)
-        self.bg_time = pygame.transform.scale(raw_time_img, self.hud_size)
-        self.bg_money = pygame.transform.scale(raw_money_img, self.hud_size)
+    def _format(self, money, current_time, total_duration):
+        """Return the (time, money) strings shown on the HUD"""
+        # Calculate remaining time
+        remaining = max(0, total_duration - current_time)
+
+        # Format time as MM:SS
+        time_str = f"{int(remaining // 60):02}:{int(remaining % 60):02}"
+
+        # Format money with dollar sign
+        money_str = f"${int(money)}"
+        return time_str, money_str
+
+    def dirty_region(self, money, current_time, total_duration):
+        """Rect covering both icons and the shown strings, for the dirty rect renderer"""
+        rect = self.bg_time.get_rect(topleft=self.time_pos).union(
+            self.bg_money.get_rect(topleft=self.money_pos))
+        return rect, self._format(money, current_time, total_duration)
 
-    def render(self, screen, money, current_time, total_duration):
+    def render(self, screen, money, current_time, total_duration, offset=(0, 0)):
         """
         Render HUD elements to screen
         
@@ -46,24 +62,20 @@ class HUD:
             money (float): Current money amount
             current_time (float): Elapsed time in seconds
             total_duration (float): Total game duration in seconds
+            offset (tuple): Added to every position (drawing into a cropped layer)
         """
-        # Calculate remaining time
-        remaining = max(0, total_duration - current_time)
-        
-        # Format time as MM:SS
-        time_str = f"{int(remaining // 60):02}:{int(remaining % 60):02}"
-        
-        # Format money with dollar sign
-        money_str = f"${int(money)}"
+        time_str, money_str = self._format(money, current_time, total_duration)
+        time_pos = (self.time_pos[0] + offset[0], self.time_pos[1] + offset[1])
+        money_pos = (self.money_pos[0] + offset[0], self.money_pos[1] + offset[1])
 
         # Draw background icon
-        screen.blit(self.bg_time, self.time_pos)
+        screen.blit(self.bg_time, time_pos)
 
         # Get background rect on screen
-        bg_rect_time = self.bg_time.get_rect(topleft=self.time_pos)
+        bg_rect_time = self.bg_time.get_rect(topleft=time_pos)
 
         # Render time text
-        time_surf = self.font.render(time_str, True, COLOR_WHITE)
+        time_surf = text_cache.render(FONT_PATH, self.font_size, time_str, COLOR_WHITE)
         
         # Center text on background
         time_text_rect = time_surf.get_rect(center=bg_rect_time.center)
@@ -72,13 +84,13 @@ class HUD:
         screen.blit(time_surf, time_text_rect)
 
         # Draw background icon
-        screen.blit(self.bg_money, self.money_pos)
+        screen.blit(self.bg_money, money_pos)
 
         # Get background rect on screen
-        bg_rect_money = self.bg_money.get_rect(topleft=self.money_pos)
+        bg_rect_money = self.bg_money.get_rect(topleft=money_pos)
 
         # Render money text
-        money_surf = self.font.render(money_str, True, COLOR_WHITE)
+        money_surf = text_cache.render(FONT_PATH, self.font_size, money_str, COLOR_WHITE)
         
         # Center text on background
         money_text_rect = money_surf.get_rect(center=bg_rect_money.center)
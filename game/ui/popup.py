@@ -6,6 +6,7 @@ Shows a short message that moves upward and fades out
 import pygame
 # TODO 12.05修改替换
 from config.settings import *
+from game.managers.text_cache import text_cache
 
 
 class FloatingText:
@@ -13,6 +14,14 @@ class FloatingText:
 
     def __init__(self, x, y, text, color=COLOR_WHITE, duration=1.0):
         """Create a floating text at (x, y) with a lifetime in seconds."""
+        self.font_size = 36 # TODO 12.05修改替换
+        self.reset(x, y, text, color, duration)
+
+    def reset(self, x, y, text, color=COLOR_WHITE, duration=1.0):
+        """
+        (Re)start the popup, so PopupLayer can recycle finished ones.
+        The text surface is shared with the text cache; alpha is applied when drawn.
+        """
         self.x = x
         self.y = y - 60 # TODO 12.05修改替换
         self.text = text
@@ -23,8 +32,8 @@ class FloatingText:
         self.timer = 0
 
         # Rendering settings
-        self.font = pygame.font.Font(FONT_PATH, 36) # TODO 12.05修改替换
         self.alpha = 255  # 255 = opaque, 0 = fully transparent
+        self.image = text_cache.render(FONT_PATH, self.font_size, text, color)
 
     def update(self, dt):
         """
@@ -43,8 +52,71 @@ class FloatingText:
 
         return self.timer < self.duration
 
-    def render(self, screen):
-        """Render the floating text centered at x with current alpha."""
-        text_surf = self.font.render(self.text, True, self.color)
-        text_surf.set_alpha(self.alpha)
-        screen.blit(text_surf, (self.x - text_surf.get_width() // 2, self.y))
+    def get_pos(self):
+        """Top-left position, centered at x"""
+        return (self.x - self.image.get_width() // 2, self.y)
+
+    def dirty_region(self):
+        """Screen rect and current alpha, for the dirty rect renderer"""
+        return pygame.Rect(self.get_pos(), self.image.get_size()), self.alpha
+
+
+class PopupLayer:
+    """
+    All live floating texts of a state.
+
+    Finished popups go back to a pool and are reused by spawn(). At most
+    max_popups are alive; a burst beyond that recycles the oldest one.
+    submit() queues them on the frame draw list with their current alpha.
+    """
+
+    def __init__(self, max_popups=POPUP_LIMIT):
+        """
+        Args:
+            max_popups (int): Cap on popups alive at the same time
+        """
+        self.max_popups = max_popups
+        self.active = []    # oldest first
+        self.pool = []      # finished popups waiting for reuse
+
+    def spawn(self, x, y, text, color=COLOR_WHITE, duration=1.0):
+        """Start a popup at (x, y), reusing a pooled one when possible."""
+        if len(self.active) >= self.max_popups:
+            popup = self.active.pop(0)
+        elif self.pool:
+            popup = self.pool.pop()
+        else:
+            popup = None
+
+        if popup is None:
+            popup = FloatingText(x, y, text, color, duration)
+        else:
+            popup.reset(x, y, text, color, duration)
+        self.active.append(popup)
+        return popup
+
+    def update(self, dt):
+        """Advance every popup and move finished ones back to the pool."""
+        alive = []
+        for popup in self.active:
+            if popup.update(dt):
+                alive.append(popup)
+            else:
+                self.pool.append(popup)
+        self.active = alive
+
+    def submit(self, draw_list, layer):
+        """Queue all live popups on a frame draw list."""
+        for p in self.active:
+            draw_list.add(layer, p.image, p.get_pos(), alpha=p.alpha)
+
+    def clear(self):
+        """Drop every live popup into the pool"""
+        self.pool.extend(self.active)
+        self.active = []
+
+    def __len__(self):
+        return len(self.active)
+
+    def __iter__(self):
+        return iter(self.active)
@@ -1,20 +1,59 @@
 """
 Lost but Found - Main Entry Point
+
+Usage:
+    python start.py                     run the game
+    python start.py --measure-startup   print a startup time breakdown and exit
+    python start.py --dirty-rects       present only changed screen regions
+    python start.py --render-res 800x450    render at a lower internal resolution
+    python start.py --sdl2              draw with the SDL2 texture backend
+    python start.py --render-thread     draw on a render thread while the main thread simulates
 """
 
 import sys
-from game.game_manager import GameManager
+import time
+
+
+def print_startup_report(start_time, marks):
+    """Print how long each startup step took (marks: (label, perf_counter) pairs)"""
+    print("Startup report")
+    previous = start_time
+    for label, stamp in marks:
+        print(f"  {label:<18}{(stamp - previous) * 1000:8.1f} ms")
+        previous = stamp
+    print(f"  {'total':<18}{(previous - start_time) * 1000:8.1f} ms")
+
 
 def main():
     """main entry point"""
+    measure_startup = '--measure-startup' in sys.argv[1:]
+    dirty_rects = '--dirty-rects' in sys.argv[1:]
+    render_res = None
+    if '--render-res' in sys.argv[1:]:
+        width, height = sys.argv[sys.argv.index('--render-res') + 1].split('x')
+        render_res = (int(width), int(height))
+    start_time = time.perf_counter()
+
+    # Import here so the import cost shows up in the startup report
+    from game.game_manager import GameManager
+    from config.settings import DIRTY_RECTS, RENDER_RESOLUTION, RENDER_BACKEND, RENDER_THREAD
+    import_done = time.perf_counter()
+
     # Instantiate GameManager
-    game = GameManager()
+    game = GameManager(exit_when_interactive=measure_startup,
+                       dirty_rects=dirty_rects or DIRTY_RECTS,
+                       render_resolution=render_res or RENDER_RESOLUTION,
+                       backend='sdl2' if '--sdl2' in sys.argv[1:] else RENDER_BACKEND,
+                       render_thread='--render-thread' in sys.argv[1:] or RENDER_THREAD)
 
     # Run the game
     game.run()
 
+    if measure_startup:
+        print_startup_report(start_time, [('import', import_done)] + game.startup_marks)
+
     # Exit
     sys.exit()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,22 @@
+"""
+Shared fakes for tests that run with pygame mocked out
+"""
+
+from unittest.mock import MagicMock
+
+
+def make_surface(width, height, **attrs):
+    """
+    Fake surface with a real size (32 bit, 4 bytes per pixel).
+
+    Args:
+        width, height (int): Surface size
+        **attrs: Extra attributes to set on the fake (e.g. fill_byte)
+    """
+    surface = MagicMock(**attrs)
+    surface.get_width.return_value = width
+    surface.get_height.return_value = height
+    surface.get_size.return_value = (width, height)
+    surface.get_bytesize.return_value = 4
+    surface.get_bitsize.return_value = 32
+    return surface
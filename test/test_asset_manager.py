@@ -0,0 +1,83 @@
+import unittest
+import sys
+import os
+from unittest.mock import MagicMock, patch
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+sys.path.insert(0, project_root)
+
+# Mock Pygame
+mock_pygame = MagicMock()
+sys.modules['pygame'] = mock_pygame
+sys.modules['pygame.mixer'] = mock_pygame.mixer
+sys.modules['pygame.image'] = mock_pygame.image
+sys.modules['pygame.font'] = mock_pygame.font
+sys.modules['pygame.mouse'] = mock_pygame.mouse
+
+from game.managers import asset_manager as asset_module
+from game.managers.asset_manager import AssetManager
+from test.fakes import make_surface
+
+
+class TestAssetManager(unittest.TestCase):
+
+    def setUp(self):
+        """patch pygame so every load returns a 10x10 surface (400 bytes)"""
+        patcher = patch.object(asset_module, 'pygame')
+        self.pygame = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.pygame.image.load.side_effect = lambda path: make_surface(10, 10)
+        self.pygame.transform.scale.side_effect = lambda surf, size: make_surface(*size)
+        self.pygame.display.get_surface.return_value = None     # no window -> no convert()
+
+    def test_second_request_is_a_hit(self):
+        """test 1: same key -> one disk load, one hit"""
+        assets = AssetManager(budget_bytes=10_000)
+        first = assets.image('a.png', (10, 10))
+        second = assets.image('a.png', (10, 10))
+
+        self.assertIs(first, second)
+        self.assertEqual(self.pygame.image.load.call_count, 1)
+        self.assertEqual((assets.hits, assets.misses), (1, 1))
+
+    def test_size_is_part_of_the_key(self):
+        """test 2: different target sizes are cached separately"""
+        assets = AssetManager(budget_bytes=10_000)
+        small = assets.image('a.png', (10, 10))
+        large = assets.image('a.png', (20, 20))
+
+        self.assertIsNot(small, large)
+        self.assertEqual(assets.bytes_used, 400 + 1600)
+
+    def test_lru_eviction_over_budget(self):
+        """test 3: over budget -> least recently used entry is dropped"""
+        assets = AssetManager(budget_bytes=1000)
+        assets.image('a.png', (10, 10))
+        assets.image('b.png', (10, 10))
+        assets.image('a.png', (10, 10))     # a is now most recent
+        assets.image('c.png', (10, 10))     # 1200 bytes -> evict b
+
+        self.assertEqual(assets.evictions, 1)
+        self.assertLessEqual(assets.bytes_used, 1000)
+        assets.image('a.png', (10, 10))
+        self.assertEqual(self.pygame.image.load.call_count, 3)
+
+    def test_low_tier_npc_copy_is_shared(self):
+        """test 4: half tier stores npcs at half size, the full-size copy is made once and counted"""
+        self.pygame.transform.smoothscale.side_effect = lambda surf, size: make_surface(*size)
+        assets = AssetManager(budget_bytes=10_000_000)
+        assets.quality = 'half'
+        path = asset_module.npc_paths()[0]
+        first = assets.image(path, (40, 50))
+        second = assets.image(path, (40, 50))
+
+        self.assertIs(first, second)
+        self.assertEqual(first.get_size(), (40, 50))
+        sizes = [call.args[1] for call in self.pygame.transform.smoothscale.call_args_list]
+        self.assertEqual(sizes, [(20, 25), (40, 50)])   # stored half size, one copy back up
+        self.assertEqual(assets.bytes_used, 20 * 25 * 4 + 40 * 50 * 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+import sys
+import os
+from unittest.mock import MagicMock, patch
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+sys.path.insert(0, project_root)
+
+# Mock Pygame
+mock_pygame = MagicMock()
+sys.modules['pygame'] = mock_pygame
+sys.modules['pygame.mixer'] = mock_pygame.mixer
+sys.modules['pygame.image'] = mock_pygame.image
+sys.modules['pygame.font'] = mock_pygame.font
+sys.modules['pygame.mouse'] = mock_pygame.mouse
+
+from game.render import belt_strip as belt_module
+from game.render.belt_strip import BeltStrip
+
+TEX_W, TEX_H, SCREEN_H = 160, 48, 200
+
+
+def tiled_row(scroll_offset, screen_y):
+    """texture row at screen_y with the old per-tile loop (the last tile drawn wins)"""
+    y_offset = int(scroll_offset) % TEX_H
+    row = None
+    for y in range(-TEX_H, SCREEN_H + TEX_H, TEX_H):
+        top = y + y_offset
+        if top <= screen_y < top + TEX_H:
+            row = screen_y - top
+    return row
+
+
+class TestBeltStrip(unittest.TestCase):
+
+    def setUp(self):
+        """patch pygame and the asset manager, the strip itself is never drawn"""
+        for name in ('pygame', 'asset_manager'):
+            patcher = patch.object(belt_module, name)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        texture = MagicMock()
+        texture.get_size.return_value = (TEX_W, TEX_H)
+        self.belt = BeltStrip(texture, [140], SCREEN_H)
+
+    def test_source_top_matches_the_tiled_loop(self):
+        """test 1: strip row shown at every screen row equals the old tiling"""
+        for scroll_offset in (0, 1, 17.6, TEX_H - 1, TEX_H, 1000.25, 123456):
+            top = self.belt.source_top(scroll_offset)
+            self.assertTrue(0 <= top < TEX_H)
+            for screen_y in range(SCREEN_H):
+                # the strip is tiled from row 0, so strip row r shows texture row r % TEX_H
+                self.assertEqual((top + screen_y) % TEX_H, tiled_row(scroll_offset, screen_y),
+                                 f"offset {scroll_offset}, screen row {screen_y}")
+
+    def test_lane_position(self):
+        """test 2: the strip starts at the left edge of the lane"""
+        self.assertEqual(self.belt.x, 140 - TEX_W // 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+import unittest
+import sys
+import os
+from unittest.mock import MagicMock, patch
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+sys.path.insert(0, project_root)
+
+# Mock Pygame
+mock_pygame = MagicMock()
+sys.modules['pygame'] = mock_pygame
+sys.modules['pygame.mixer'] = mock_pygame.mixer
+sys.modules['pygame.image'] = mock_pygame.image
+sys.modules['pygame.font'] = mock_pygame.font
+sys.modules['pygame.mouse'] = mock_pygame.mouse
+
+from game.render import dirty_rects as dirty_module
+from game.render.dirty_rects import merge_rects, DirtyRectRenderer
+
+
+class FakeRect:
+    """the parts of pygame.Rect the dirty rect renderer uses"""
+
+    def __init__(self, *args):
+        if len(args) == 1:
+            args = tuple(args[0])
+        self.x, self.y, self.w, self.h = args
+
+    def __iter__(self):
+        return iter((self.x, self.y, self.w, self.h))
+
+    def __eq__(self, other):
+        return tuple(self) == tuple(other)
+
+    def colliderect(self, other):
+        return (self.x < other.x + other.w and other.x < self.x + self.w
+                and self.y < other.y + other.h and other.y < self.y + self.h)
+
+    def union(self, other):
+        left, top = min(self.x, other.x), min(self.y, other.y)
+        right = max(self.x + self.w, other.x + other.w)
+        bottom = max(self.y + self.h, other.y + other.h)
+        return FakeRect(left, top, right - left, bottom - top)
+
+    def union_ip(self, other):
+        self.x, self.y, self.w, self.h = self.union(other)
+
+    def unionall(self, others):
+        rect = self
+        for other in others:
+            rect = rect.union(other)
+        return rect
+
+    def clip(self, other):
+        left, top = max(self.x, other.x), max(self.y, other.y)
+        right = min(self.x + self.w, other.x + other.w)
+        bottom = min(self.y + self.h, other.y + other.h)
+        return FakeRect(left, top, max(0, right - left), max(0, bottom - top))
+
+
+class TestMergeRects(unittest.TestCase):
+
+    def setUp(self):
+        patcher = patch.object(dirty_module.pygame, 'Rect', FakeRect)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_overlapping_rects_are_joined(self):
+        """test 1: a chain of overlapping rects becomes one, separate ones stay"""
+        merged = merge_rects([(0, 0, 10, 10), (100, 100, 5, 5), (5, 5, 10, 10), (12, 12, 10, 10)], 8)
+
+        self.assertEqual(sorted(tuple(r) for r in merged), [(0, 0, 22, 22), (100, 100, 5, 5)])
+
+    def test_cheapest_pair_is_merged_over_the_limit(self):
+        """test 2: over max_rects the pair with the least wasted area is joined"""
+        merged = merge_rects([(0, 0, 10, 10), (20, 0, 10, 10), (500, 500, 10, 10)], 2)
+
+        self.assertEqual(sorted(tuple(r) for r in merged), [(0, 0, 30, 10), (500, 500, 10, 10)])
+
+
+class TestDirtyRectRenderer(unittest.TestCase):
+
+    def setUp(self):
+        """fake 100x100 screen, pygame.display patched"""
+        patcher = patch.object(dirty_module, 'pygame')
+        self.pygame = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.pygame.Rect = FakeRect
+        self.screen = MagicMock()
+        self.screen.get_rect.return_value = FakeRect(0, 0, 100, 100)
+        self.draw = MagicMock()
+        self.owner = object()
+
+    def present(self, renderer, regions):
+        renderer.present(self.screen, self.owner, regions, self.draw)
+
+    def test_small_change_presents_only_dirty_rects(self):
+        """test 3: a moved sprite presents its old and new rect, no flip"""
+        renderer = DirtyRectRenderer(max_area=0.5, max_rects=8)
+        self.present(renderer, {'a': ((0, 0, 10, 10), 1), 'b': ((50, 50, 10, 10), 1)})
+        self.present(renderer, {'a': ((20, 0, 10, 10), 1), 'b': ((50, 50, 10, 10), 1)})
+
+        self.assertEqual(renderer.full_frames, 1)   # only the first frame
+        self.pygame.display.update.assert_called_once()
+        presented = sorted(tuple(r) for r in self.pygame.display.update.call_args[0][0])
+        self.assertEqual(presented, [(0, 0, 10, 10), (20, 0, 10, 10)])
+
+    def test_large_change_falls_back_to_a_full_flip(self):
+        """test 4: dirty share over max_area -> full redraw and flip"""
+        renderer = DirtyRectRenderer(max_area=0.5, max_rects=8)
+        self.present(renderer, {'a': ((0, 0, 10, 10), 1)})
+        self.present(renderer, {'a': ((0, 0, 10, 10), 2), 'big': ((0, 20, 100, 60), 1)})
+
+        self.assertEqual(renderer.full_frames, 2)
+        self.assertEqual(self.pygame.display.flip.call_count, 2)
+        self.pygame.display.update.assert_not_called()
+
+    def test_unchanged_frame_draws_nothing(self):
+        """test 5: same regions and looks -> no draw, no present"""
+        renderer = DirtyRectRenderer()
+        self.present(renderer, {'a': ((0, 0, 10, 10), 1)})
+        self.present(renderer, {'a': ((0, 0, 10, 10), 1)})
+
+        self.assertEqual(self.draw.call_count, 1)
+        self.pygame.display.update.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
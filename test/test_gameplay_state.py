@@ -1,7 +1,7 @@
 import unittest
 import sys
 import os
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 current_dir = os.path.dirname(os.path.abspath(__file__))
 project_root = os.path.dirname(current_dir)
@@ -15,6 +15,8 @@ sys.modules['pygame.image'] = mock_pygame.image
 sys.modules['pygame.font'] = mock_pygame.font
 sys.modules['pygame.mouse'] = mock_pygame.mouse
 
+from game.states import gameplay_state as gameplay_module
+
 try:
     from game.states.gameplay_state import GameplayState
 except ImportError:
@@ -62,5 +64,28 @@ class TestGameplayState(unittest.TestCase):
 
         print("Pass: success")
 
+    def test_hover_follows_sliding_desk_items(self):
+        """test 3: desk items sliding under a still mouse -> hover is searched every frame"""
+        self.game.conveyor_items = []
+        self.game.inventory_manager = MagicMock(version=0, items_moving=True)
+        item = MagicMock()
+        self.game.inventory_manager.get_item_at_position.side_effect = [None, item]
+        with patch.object(gameplay_module.viewport, 'mouse_pos', return_value=(700, 500)):
+            self.game._update_hover()
+            self.game._update_hover()
+
+        self.assertIs(self.game.hovered_item, item)
+
+    def test_hover_skipped_when_nothing_moves(self):
+        """test 4: still mouse, still desk -> one search only"""
+        self.game.conveyor_items = []
+        self.game.inventory_manager = MagicMock(version=0, items_moving=False)
+        self.game.inventory_manager.get_item_at_position.return_value = None
+        with patch.object(gameplay_module.viewport, 'mouse_pos', return_value=(700, 500)):
+            self.game._update_hover()
+            self.game._update_hover()
+
+        self.assertEqual(self.game.inventory_manager.get_item_at_position.call_count, 1)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,95 @@
+import unittest
+import sys
+import os
+import tempfile
+from unittest.mock import MagicMock, patch
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+sys.path.insert(0, project_root)
+
+# Mock Pygame
+mock_pygame = MagicMock()
+sys.modules['pygame'] = mock_pygame
+sys.modules['pygame.mixer'] = mock_pygame.mixer
+sys.modules['pygame.image'] = mock_pygame.image
+sys.modules['pygame.font'] = mock_pygame.font
+sys.modules['pygame.mouse'] = mock_pygame.mouse
+
+from game.managers import sprite_cache as cache_module
+from game.managers.sprite_cache import bake_sprite_cache, SpriteCache
+from test.fakes import make_surface
+
+
+class TestSpriteCache(unittest.TestCase):
+
+    def setUp(self):
+        """two source files, pygame patched so pixels are the first byte of the file repeated
+        (fake surfaces carry it as fill_byte)"""
+        patcher = patch.object(cache_module, 'pygame')
+        self.pygame = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.pygame.error = type('error', (Exception,), {})
+        self.pygame.image.load.side_effect = self.load
+        self.pygame.transform.scale.side_effect = lambda surf, size: make_surface(*size, fill_byte=surf.fill_byte)
+        self.pygame.image.tostring.side_effect = \
+            lambda surf, fmt: bytes([surf.fill_byte]) * (surf.get_size()[0] * surf.get_size()[1] * 4)
+        self.pygame.image.frombuffer.side_effect = lambda pixels, size, fmt: (bytes(pixels), size)
+
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = tmp.name
+        self.cache_path = os.path.join(self.dir, 'sprites.bin')
+        self.a = self.write('a.png', b'\x07')
+        self.b = self.write('b.png', b'\x09')
+        self.targets = [(self.a, (3, 2)), (self.b, (5, 1))]
+
+    def write(self, name, content):
+        path = os.path.join(self.dir, name)
+        with open(path, 'wb') as f:
+            f.write(content)
+        return path
+
+    def load(self, path):
+        with open(path, 'rb') as f:
+            return make_surface(1, 1, fill_byte=f.read()[0])
+
+    def test_round_trip(self):
+        """test 1: baked entries come back with the decoded + scaled pixels"""
+        self.assertEqual(bake_sprite_cache(self.targets, self.cache_path),
+                         {'rebuilt': 2, 'reused': 0, 'failed': 0})
+        cache = SpriteCache(self.cache_path)
+        self.addCleanup(cache.close)
+
+        self.assertEqual(cache.get(self.a, (3, 2)), (b'\x07' * 24, (3, 2)))
+        self.assertEqual(cache.get(self.b, (5, 1)), (b'\x09' * 20, (5, 1)))
+        self.assertIsNone(cache.get(self.a, (4, 4)))    # size not baked
+
+    def test_rebake_reuses_unchanged_entries(self):
+        """test 2: only the changed source is decoded again"""
+        bake_sprite_cache(self.targets, self.cache_path)
+        self.write('b.png', b'\x0b')
+        self.pygame.image.load.reset_mock()
+
+        self.assertEqual(bake_sprite_cache(self.targets, self.cache_path),
+                         {'rebuilt': 1, 'reused': 1, 'failed': 0})
+        self.pygame.image.load.assert_called_once_with(self.b)
+        cache = SpriteCache(self.cache_path)
+        self.addCleanup(cache.close)
+        self.assertEqual(cache.get(self.a, (3, 2))[0], b'\x07' * 24)
+        self.assertEqual(cache.get(self.b, (5, 1))[0], b'\x0b' * 20)
+
+    def test_changed_source_is_stale(self):
+        """test 3: a source edited after the bake is not served from the cache"""
+        bake_sprite_cache(self.targets, self.cache_path)
+        cache = SpriteCache(self.cache_path)
+        self.addCleanup(cache.close)
+        self.write('a.png', b'\x07\x07')
+
+        self.assertFalse(cache.has(self.a, (3, 2)))
+        self.assertIsNone(cache.get(self.a, (3, 2)))
+        self.assertTrue(cache.has(self.b, (5, 1)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import unittest
+import sys
+import os
+from unittest.mock import MagicMock
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+sys.path.insert(0, project_root)
+
+# Mock Pygame
+mock_pygame = MagicMock()
+sys.modules['pygame'] = mock_pygame
+sys.modules['pygame.mixer'] = mock_pygame.mixer
+sys.modules['pygame.image'] = mock_pygame.image
+sys.modules['pygame.font'] = mock_pygame.font
+sys.modules['pygame.mouse'] = mock_pygame.mouse
+
+from game.entities.sticky_note import StickyNote
+from game.render.draw_list import DrawList, ITEMS, SHADOWS, SPRITE
+from game.states.gameplay_state import GameplayState
+
+
+class TestStickyNoteTransforms(unittest.TestCase):
+
+    def setUp(self):
+        """draw list of a backend that rotates sprites itself (sdl2)"""
+        self.draw_list = DrawList()
+        self.draw_list.transforms = True
+        self.note = StickyNote(100, 100, 'book')
+        self.note.rect = MagicMock(center=(100, 100))
+
+    def test_submit_queues_the_note_as_a_sprite(self):
+        """test 1: a note is queued unrotated from its own stamped image"""
+        self.note.submit(self.draw_list, ITEMS)
+
+        layer, kind, data = self.draw_list.take()[0]
+        self.assertEqual((layer, kind), (ITEMS, SPRITE))
+        self.assertIs(data[0], self.note.image)
+        self.assertEqual((data[1], data[2]), ((100, 100), 0.0))
+
+    def test_shadow_of_a_note(self):
+        """test 2: the gameplay shadow pass takes notes like any other item"""
+        game = GameplayState(MagicMock())
+        game._draw_item_shadow(self.draw_list, self.note)
+
+        layer, kind, data = self.draw_list.take()[0]
+        self.assertEqual((layer, kind), (SHADOWS, SPRITE))
+        self.assertIs(data[0], self.note.image)
+        self.assertEqual(data[1], (105, 105))
+        self.assertTrue(data[4])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+import unittest
+import sys
+import os
+from unittest.mock import MagicMock, patch
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+sys.path.insert(0, project_root)
+
+# Mock Pygame
+mock_pygame = MagicMock()
+sys.modules['pygame'] = mock_pygame
+sys.modules['pygame.mixer'] = mock_pygame.mixer
+sys.modules['pygame.image'] = mock_pygame.image
+sys.modules['pygame.font'] = mock_pygame.font
+sys.modules['pygame.mouse'] = mock_pygame.mouse
+
+from game.managers import text_cache as text_module
+from game.managers.text_cache import TextCache
+
+
+class TestTextCache(unittest.TestCase):
+
+    def setUp(self):
+        """patch the asset manager so every render returns a new fake surface"""
+        patcher = patch.object(text_module, 'asset_manager')
+        self.assets = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.font = self.assets.font.return_value
+        self.font.render.side_effect = lambda text, antialias, color: MagicMock(text=text)
+
+    def test_same_string_is_rendered_once(self):
+        """test 1: same key -> one Font.render(), counted per frame"""
+        cache = TextCache(max_entries=4)
+        first = cache.render(None, 24, 'Money: 10', (255, 255, 255))
+        second = cache.render(None, 24, 'Money: 10', [255, 255, 255])
+        cache.end_frame()
+
+        self.assertIs(first, second)
+        self.assertEqual(self.font.render.call_count, 1)
+        self.assertEqual((cache.stats()['frame_hits'], cache.stats()['frame_misses']), (1, 1))
+
+    def test_color_is_part_of_the_key(self):
+        """test 2: a different color is a different surface"""
+        cache = TextCache(max_entries=4)
+        white = cache.render(None, 24, 'OK', (255, 255, 255))
+        red = cache.render(None, 24, 'OK', (255, 0, 0))
+
+        self.assertIsNot(white, red)
+
+    def test_lru_eviction(self):
+        """test 3: over max_entries -> least recently used string is dropped"""
+        cache = TextCache(max_entries=2)
+        cache.render(None, 24, 'a', (0, 0, 0))
+        cache.render(None, 24, 'b', (0, 0, 0))
+        cache.render(None, 24, 'a', (0, 0, 0))     # a is now most recent
+        cache.render(None, 24, 'c', (0, 0, 0))     # evicts b
+
+        self.assertEqual(cache.evictions, 1)
+        self.assertEqual(len(cache.cache), 2)
+        cache.render(None, 24, 'a', (0, 0, 0))
+        self.assertEqual(self.font.render.call_count, 3)
+        cache.render(None, 24, 'b', (0, 0, 0))
+        self.assertEqual(self.font.render.call_count, 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
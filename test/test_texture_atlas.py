@@ -0,0 +1,73 @@
+import unittest
+import sys
+import os
+from unittest.mock import MagicMock, patch
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+sys.path.insert(0, project_root)
+
+# Mock Pygame
+mock_pygame = MagicMock()
+sys.modules['pygame'] = mock_pygame
+sys.modules['pygame.mixer'] = mock_pygame.mixer
+sys.modules['pygame.image'] = mock_pygame.image
+sys.modules['pygame.font'] = mock_pygame.font
+sys.modules['pygame.mouse'] = mock_pygame.mouse
+
+from game.managers import texture_atlas as atlas_module
+from game.managers.texture_atlas import TextureAtlas
+from test.fakes import make_surface
+
+
+def make_page(size, flags=0):
+    """fake atlas page whose regions are the (x, y, w, h) they were cut at"""
+    page = MagicMock()
+    page.get_width.return_value, page.get_height.return_value = size
+    page.subsurface.side_effect = lambda rect: rect
+    return page
+
+
+class TestTextureAtlas(unittest.TestCase):
+
+    def setUp(self):
+        """patch pygame so pages are fakes and Rect is a plain tuple"""
+        patcher = patch.object(atlas_module, 'pygame')
+        self.pygame = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.pygame.Surface.side_effect = make_page
+        self.pygame.Rect.side_effect = lambda x, y, w, h: (x, y, w, h)
+
+    def test_shelves_tallest_first(self):
+        """test 1: sprites fill a row left to right, the next row starts under the tallest"""
+        atlas = TextureAtlas(page_size=100, padding=1)
+        atlas.build([('small', make_surface(40, 20)), ('tall', make_surface(40, 30)),
+                     ('next_row', make_surface(40, 10))])
+
+        self.assertEqual(atlas.get('tall'), (0, 0, 40, 30))
+        self.assertEqual(atlas.get('small'), (41, 0, 40, 20))
+        self.assertEqual(atlas.get('next_row'), (0, 31, 40, 10))
+        self.assertEqual(len(atlas.pages), 1)
+        self.assertEqual(atlas.pages[0].get_height(), 41)   # trimmed to the used height
+
+    def test_overflow_starts_a_new_page(self):
+        """test 2: a sprite that does not fit under the last shelf goes to a new page"""
+        atlas = TextureAtlas(page_size=100, padding=0)
+        atlas.build([('a', make_surface(100, 60)), ('b', make_surface(100, 50))])
+
+        self.assertEqual(atlas.stats()['pages'], 2)
+        self.assertEqual(atlas.get('a'), (0, 0, 100, 60))
+        self.assertEqual(atlas.get('b'), (0, 0, 100, 50))
+        atlas.pages[1].blit.assert_called_once()
+
+    def test_too_large_sprite_is_skipped(self):
+        """test 3: sprites larger than a page are left out"""
+        atlas = TextureAtlas(page_size=100)
+        atlas.build([('huge', make_surface(120, 10)), ('ok', make_surface(10, 10))])
+
+        self.assertIsNone(atlas.get('huge'))
+        self.assertIsNotNone(atlas.get('ok'))
+
+
+if __name__ == '__main__':
+    unittest.main()